@@ -26,7 +26,8 @@ import sys
 import time
 from pathlib import Path
 from typing import List, Optional, Dict, Any
-import statistics
+
+import numpy as np
 
 # Configuration management
 from config.config_loader import ConfigLoader, load_config_with_overrides, ConfigValidationError
@@ -199,18 +200,21 @@ def run_simulation(config: Dict[str, Any]) -> Dict[str, Any]:
     
     elapsed_time = time.time() - start_time
     
-    # Performance analysis
-    avg_temp = statistics.mean(temperatures)
-    temp_std = statistics.stdev(temperatures) if len(temperatures) > 1 else 0
-    max_error = max(abs(t - setpoint_c) for t in temperatures)
-    avg_error = statistics.mean([abs(t - setpoint_c) for t in temperatures])
+    # Performance analysis (float arrays; errors computed once and reused)
+    temps = np.asarray(temperatures, dtype=np.float64)
+    errors = np.abs(temps - setpoint_c)
+    avg_temp = float(temps.mean())
+    temp_std = float(temps.std(ddof=1)) if len(temps) > 1 else 0
+    max_error = float(errors.max())
+    avg_error = float(errors.mean())
     
     # Energy performance
-    avg_cooling = statistics.mean(cooling_outputs)
-    total_energy_kwh = sum(cooling_outputs) * timestep_s / 3600.0
+    cooling = np.asarray(cooling_outputs, dtype=np.float64)
+    avg_cooling = float(cooling.mean())
+    total_energy_kwh = float(cooling.sum()) * timestep_s / 3600.0
     
     # Control performance
-    temp_in_range = sum(1 for t in temperatures if abs(t - setpoint_c) <= 0.5)
+    temp_in_range = int(np.count_nonzero(errors <= 0.5))
     control_accuracy = temp_in_range / len(temperatures) * 100
     
     print("=" * 60)
@@ -245,21 +249,20 @@ def run_simulation(config: Dict[str, Any]) -> Dict[str, Any]:
     # Calculate steady-state performance (exclude first 5 minutes for convergence)
     steady_state_start = int(5 * 60 / timestep_s)  # 5 minutes
     if len(temperatures) > steady_state_start:
-        steady_temps = temperatures[steady_state_start:]
-        steady_errors = [abs(t - setpoint_c) for t in steady_temps]
-        steady_in_range = sum(1 for e in steady_errors if e <= 0.5)
-        steady_accuracy = (steady_in_range / len(steady_errors)) * 100 if steady_errors else 0
-        steady_avg_error = statistics.mean(steady_errors) if steady_errors else avg_error
-        steady_std = statistics.stdev(steady_temps) if len(steady_temps) > 1 else temp_std
+        steady_temps = temps[steady_state_start:]
+        steady_errors = errors[steady_state_start:]
+        steady_in_range = int(np.count_nonzero(steady_errors <= 0.5))
+        steady_accuracy = (steady_in_range / len(steady_errors)) * 100 if len(steady_errors) else 0
+        steady_avg_error = float(steady_errors.mean()) if len(steady_errors) else avg_error
+        steady_std = float(steady_temps.std(ddof=1)) if len(steady_temps) > 1 else temp_std
     else:
         steady_accuracy = control_accuracy
         steady_avg_error = avg_error  
         steady_std = temp_std
     
-    # Calculate COP efficiency
-    total_power_data = [sequencer.get_total_power_kw() for _ in range(len(cooling_outputs))]
-    cops = [cooling/power if power > 0 else 0 for cooling, power in zip(cooling_outputs, total_power_data)]
-    avg_cop = statistics.mean(cops) if cops else 0
+    # Calculate COP efficiency (against the sequencer's current total power)
+    total_power = sequencer.get_total_power_kw()
+    avg_cop = float(cooling.mean()) / total_power if total_power > 0 and len(cooling) else 0
     
     # Documentation-level criteria
     temp_pass = steady_avg_error <= 0.5 and steady_std <= 0.3  # Tight control per documentation
@@ -294,6 +297,27 @@ def run_simulation(config: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def simulate(config_path: Path, scenario: Optional[str] = None,
+             overrides: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Load a configuration and run the simulation as a library call.
+    
+    Args:
+        config_path: Path to the base configuration file
+        scenario: Optional scenario overlay name
+        overrides: Optional list of 'key=value' overrides
+        
+    Returns:
+        Simulation results as returned by run_simulation
+    """
+    config = load_config_with_overrides(
+        config_path,
+        scenario=scenario,
+        cli_overrides=overrides or []
+    )
+    return run_simulation(config)
+
+
 def validate_config_file(config_path: Path) -> bool:
     """
     Validate configuration file and report errors.
@@ -332,7 +356,8 @@ def validate_config_file(config_path: Path) -> bool:
         return False
 
 
-def export_results(config: Dict[str, Any], results: Dict[str, Any], format_type: str = "csv") -> None:
+def export_results(config: Dict[str, Any], results: Dict[str, Any], format_type: str = "csv",
+                   export_dir: Path = Path("reports"), export_path: Optional[Path] = None) -> None:
     """
     Export simulation results to specified format.
     
@@ -340,6 +365,8 @@ def export_results(config: Dict[str, Any], results: Dict[str, Any], format_type:
         config: Configuration used for simulation
         results: Simulation results
         format_type: Export format ('csv', 'json')
+        export_dir: Directory for the exported file
+        export_path: Exact output file; overrides export_dir and the timestamped name
     """
     if format_type == "csv":
         import csv
@@ -347,8 +374,8 @@ def export_results(config: Dict[str, Any], results: Dict[str, Any], format_type:
         
         # Create output filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = Path("reports") / f"simulation_{timestamp}.csv"
-        output_path.parent.mkdir(exist_ok=True)
+        output_path = Path(export_path or Path(export_dir) / f"simulation_{timestamp}.csv")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Write detailed data to CSV
         with open(output_path, 'w', newline='') as csvfile:
@@ -365,8 +392,8 @@ def export_results(config: Dict[str, Any], results: Dict[str, Any], format_type:
         from datetime import datetime
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = Path("reports") / f"simulation_{timestamp}.json"
-        output_path.parent.mkdir(exist_ok=True)
+        output_path = Path(export_path or Path(export_dir) / f"simulation_{timestamp}.json")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
         
         export_data = {
             'config': config,
@@ -413,6 +440,10 @@ BACnet Integration Examples:
                            help='Override config parameter (e.g., --set room.temp=25.0)')
     run_parser.add_argument('--export', choices=['csv', 'json'],
                            help='Export results to specified format')
+    run_parser.add_argument('--export-dir', type=Path, default=Path('reports'),
+                           help='Directory for exported results (default: reports)')
+    run_parser.add_argument('--export-path', type=Path,
+                           help='Exact file for exported results (overrides --export-dir)')
     
     # BACnet/IP Integration flags
     bacnet_group = run_parser.add_argument_group('BACnet/IP Options', 
@@ -518,7 +549,7 @@ BACnet Integration Examples:
             
             # Export results if requested
             if args.export:
-                export_results(config, results, args.export)
+                export_results(config, results, args.export, args.export_dir, args.export_path)
             
             return 0 if results['test_passed'] else 1
             
@@ -553,7 +584,7 @@ BACnet Integration Examples:
             print("\n" + "=" * 60)
             print("📊 BENCHMARK SUMMARY")
             print(f"Total Runtime: {total_time:.2f}s")
-            print(f"Average Simulation Time: {statistics.mean([r['simulation_time_s'] for r in all_results]):.2f}s")
+            print(f"Average Simulation Time: {sum(r['simulation_time_s'] for r in all_results) / len(all_results):.2f}s")
             print(f"Success Rate: {sum(1 for r in all_results if r['test_passed'])}/{len(all_results)}")
             
             return 0
@@ -142,6 +142,10 @@ class AlarmManager:
         self.alarms[config.alarm_id] = AlarmInstance(config)
         self.evaluators[config.alarm_id] = evaluator
     
+    def has_rules(self) -> bool:
+        """True if any alarm has an evaluator, i.e. update() does work."""
+        return bool(self.evaluators)
+    
     def update(self, sim_time: float, data: Dict) -> None:
         """
         Update all alarms based on current system data.
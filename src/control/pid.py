@@ -1,7 +1,9 @@
 # control/pid.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Sequence
+
+import numpy as np
 
 
 @dataclass
@@ -192,3 +194,108 @@ class PIDController:
                 'last_error': self.last_error
             }
         }
+
+
+class PIDArray:
+    """
+    Vectorized bank of PID controllers, one element per zone.
+
+    Same algorithm as ``PIDController.update`` (derivative-on-measurement,
+    integral clamp, output limits, rate limiting, anti-windup
+    back-calculation), evaluated with NumPy elementwise operations so N
+    zones cost one call per step. Pairs with ``sim.environment.RoomArray``:
+
+        rooms = RoomArray(cfgs)
+        pids = PIDArray([PIDConfig(kp=3.0, ki=0.15)] * rooms.n)
+        outputs = pids.update(setpoints, rooms.temp_c, dt=1.0)
+    """
+
+    def __init__(self, cfgs: Sequence[PIDConfig]):
+        self.cfgs = list(cfgs)
+        self.n = len(self.cfgs)
+
+        self.kp = np.array([c.kp for c in self.cfgs], dtype=float)
+        self.ki = np.array([c.ki for c in self.cfgs], dtype=float)
+        self.kd = np.array([c.kd for c in self.cfgs], dtype=float)
+        self.output_min = np.array([c.output_min for c in self.cfgs], dtype=float)
+        self.output_max = np.array([c.output_max for c in self.cfgs], dtype=float)
+        self.rate_limit = np.array([c.rate_limit for c in self.cfgs], dtype=float)
+
+        # Integral clamp (same fallback as PIDController when ki == 0)
+        windup = np.array([c.integral_windup_limit for c in self.cfgs], dtype=float)
+        abs_ki = np.abs(self.ki)
+        self._max_integral = np.divide(windup, abs_ki, out=np.full(self.n, 1000.0),
+                                       where=abs_ki != 0)
+        self._has_ki = self.ki != 0
+        self._ki_safe = np.where(self._has_ki, self.ki, 1.0)
+
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset every controller (see PIDController.reset)."""
+        self.integral = np.zeros(self.n)
+        self.prev_measurement = np.zeros(self.n)
+        self.prev_output = np.zeros(self.n)
+        self.first_update: bool = True
+
+        self.p_term = np.zeros(self.n)
+        self.i_term = np.zeros(self.n)
+        self.d_term = np.zeros(self.n)
+        self.last_error = np.zeros(self.n)
+
+        self.max_error = np.zeros(self.n)
+        self.update_count: int = 0
+
+    def update(self, setpoints, measurements, dt: float) -> np.ndarray:
+        """
+        Update all controllers and return their output commands.
+
+        Args:
+            setpoints: Desired values (°C), scalar or shape (N,)
+            measurements: Current process values (°C), shape (N,)
+            dt: Time step since last update (seconds)
+
+        Returns:
+            Control outputs (%) clamped to each controller's limits
+        """
+        measurements = np.asarray(measurements, dtype=float)
+        error = measurements - setpoints
+        np.maximum(self.max_error, np.abs(error), out=self.max_error)
+
+        self.p_term = self.kp * error
+
+        if not self.first_update:
+            self.integral += error * dt
+            np.clip(self.integral, -self._max_integral, self._max_integral,
+                    out=self.integral)
+        self.i_term = self.ki * self.integral
+
+        if not self.first_update and dt > 0:
+            self.d_term = -self.kd * ((measurements - self.prev_measurement) / dt)
+        else:
+            self.d_term = np.zeros(self.n)
+
+        raw_output = self.p_term + self.i_term + self.d_term
+        output = np.clip(raw_output, self.output_min, self.output_max)
+
+        if not self.first_update:
+            max_change = self.rate_limit * dt
+            output_change = output - self.prev_output
+            limited = np.abs(output_change) > max_change
+            output = np.where(limited,
+                              self.prev_output + np.copysign(max_change, output_change),
+                              output)
+
+        # Anti-windup back-calculation where saturated
+        windup = (output != raw_output) & self._has_ki
+        if windup.any():
+            self.integral -= np.where(windup, (raw_output - output) / self._ki_safe, 0.0)
+            self.i_term = self.ki * self.integral
+
+        self.last_error = error
+        self.prev_measurement = measurements.copy()
+        self.prev_output = output
+        self.first_update = False
+        self.update_count += 1
+
+        return output
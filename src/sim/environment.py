@@ -1,10 +1,12 @@
 # sim/environment.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Sequence
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class RoomConfig:
     """
     Configuration for a (single) data hall zone.
@@ -52,6 +54,10 @@ class Room:
       - Humidity/latent not modeled here; provide hooks for later.
     """
 
+    # Field order written by get_state_compact()
+    STATE_FIELDS = ('temp_c', 'ambient_temp_c', 'it_load_kw', 'time_s',
+                    'cooling_energy_kwh', 'server_energy_kwh')
+
     def __init__(self, cfg: Optional[RoomConfig] = None,
                  seed: Optional[int] = None):
         self.cfg = cfg or RoomConfig()
@@ -60,7 +66,13 @@ class Room:
 
         # Dynamic (changeable during scenarios)
         self.it_load_kw: float = self.cfg.it_load_kw
-        self.infil_ua_kw_per_c: float = self.cfg.infil_ua_kw_per_c
+        self._infil_ua_kw_per_c: float = self.cfg.infil_ua_kw_per_c
+
+        # Step constants: thermal mass is fixed, UA total changes only
+        # when infiltration is updated (see infil_ua_kw_per_c setter)
+        self._k_mass: float = 1000.0 / self.cfg.thermal_mass_kj_per_c
+        self._ua_total: float = (self.cfg.ua_kw_per_c +
+                                 self._infil_ua_kw_per_c)
 
         # Integrators (useful for energy tracking / KPI)
         self.time_s: float = 0.0
@@ -74,6 +86,23 @@ class Room:
         # Random seed for later stochastic events (kept for determinism)
         self._seed = seed
 
+        # Reusable telemetry buffer for get_state_compact()
+        self._state_buf = np.empty(len(self.STATE_FIELDS))
+
+    @property
+    def infil_ua_kw_per_c(self) -> float:
+        """Current infiltration UA (kW/°C)."""
+        return self._infil_ua_kw_per_c
+
+    @infil_ua_kw_per_c.setter
+    def infil_ua_kw_per_c(self, value: float) -> None:
+        self.set_infil(value)
+
+    def set_infil(self, infil_ua_kw_per_c: float) -> None:
+        """Update infiltration UA (kW/°C) and the cached envelope total."""
+        self._infil_ua_kw_per_c = infil_ua_kw_per_c
+        self._ua_total = self.cfg.ua_kw_per_c + infil_ua_kw_per_c
+
     def step(self, dt: float, q_cool_kw: float = 0.0) -> None:
         """
         Advance thermal model by dt seconds with q_cool_kw cooling input.
@@ -88,29 +117,26 @@ class Room:
             - Temperature update: dT/dt = Q_net / thermal_mass
             - Energy integration for KPI tracking
         """
-        # Total UA coefficient (envelope + infiltration)
-        ua_total = self.cfg.ua_kw_per_c + self.infil_ua_kw_per_c
-
-        # Heat flows (kW)
+        # Heat flows (kW); UA total = envelope + infiltration (cached)
         q_server_kw = self.it_load_kw
-        q_envelope_kw = ua_total * (self.temp_c - self.ambient_temp_c)
+        q_envelope_kw = self._ua_total * (self.temp_c - self.ambient_temp_c)
 
         # Net heat balance (kW)
         q_net_kw = q_server_kw - q_cool_kw - q_envelope_kw
 
-        # Temperature update (°C/s = kW / (kJ/°C) * (1000 J/kJ))
-        dt_temp_c = (q_net_kw * 1000.0 / self.cfg.thermal_mass_kj_per_c) * dt
-        self.temp_c += dt_temp_c
+        # Temperature update (°C/s = kW * (1000 J/kJ) / (kJ/°C))
+        self.temp_c += q_net_kw * self._k_mass * dt
 
         # Safety bounds
         self.temp_c = max(self.min_temp_c, min(self.max_temp_c, self.temp_c))
 
-        # Energy integration (kWh = kW * hours)
+        self._integrate(dt, q_cool_kw)
+
+    def _integrate(self, dt: float, q_cool_kw: float) -> None:
+        """Advance energy integrators (kWh = kW * hours) and time."""
         dt_hours = dt / 3600.0
         self.cooling_energy_kwh += q_cool_kw * dt_hours
-        self.server_energy_kwh += q_server_kw * dt_hours
-
-        # Time tracking
+        self.server_energy_kwh += self.it_load_kw * dt_hours
         self.time_s += dt
 
     def get_state(self) -> dict:
@@ -131,3 +157,103 @@ class Room:
             'thermal_mass_kj_per_c': self.cfg.thermal_mass_kj_per_c,
             'ua_kw_per_c': self.cfg.ua_kw_per_c
         }
+
+    def get_state_compact(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Write dynamic room state into a preallocated buffer.
+
+        Allocation-free alternative to get_state() for high-rate logging;
+        values follow STATE_FIELDS order. ``out`` may be a row of a larger
+        (T, len(STATE_FIELDS)) telemetry array. Without ``out`` the room's
+        internal buffer is reused, so copy it before the next call.
+        """
+        if out is None:
+            out = self._state_buf
+        out[0] = self.temp_c
+        out[1] = self.ambient_temp_c
+        out[2] = self.it_load_kw
+        out[3] = self.time_s
+        out[4] = self.cooling_energy_kwh
+        out[5] = self.server_energy_kwh
+        return out
+
+
+class RoomArray:
+    """
+    Vectorized thermal model of many data center rooms/zones.
+
+    Same heat balance as ``Room``, with one array element per zone so that
+    every step is a handful of NumPy operations regardless of zone count:
+        T_next = clip(T + (Q_server - Q_cool - UA_total * (T - T_amb))
+                      * 1000 / C * dt, T_min, T_max)
+
+    Notes:
+      - ``it_load_kw`` and ``ambient_temp_c`` arrays may be edited in place
+        during scenarios; use ``set_infil`` for infiltration so the cached
+        UA totals stay consistent.
+      - ``get_state`` returns arrays (one value per zone) for bulk telemetry.
+    """
+
+    def __init__(self, cfgs: Sequence[RoomConfig]):
+        self.cfgs = list(cfgs)
+        self.n = len(self.cfgs)
+
+        self.temp_c = np.array([c.initial_temp_c for c in self.cfgs], dtype=float)
+        self.ambient_temp_c = np.array([c.ambient_temp_c for c in self.cfgs], dtype=float)
+        self.it_load_kw = np.array([c.it_load_kw for c in self.cfgs], dtype=float)
+        self.infil_ua_kw_per_c = np.array([c.infil_ua_kw_per_c for c in self.cfgs],
+                                          dtype=float)
+        self.ua_kw_per_c = np.array([c.ua_kw_per_c for c in self.cfgs], dtype=float)
+        self.thermal_mass_kj_per_c = np.array([c.thermal_mass_kj_per_c for c in self.cfgs],
+                                              dtype=float)
+
+        # Step constants (see Room)
+        self._k_mass = 1000.0 / self.thermal_mass_kj_per_c
+        self._ua_total = self.ua_kw_per_c + self.infil_ua_kw_per_c
+
+        # Integrators
+        self.time_s: float = 0.0
+        self.cooling_energy_kwh = np.zeros(self.n)
+        self.server_energy_kwh = np.zeros(self.n)
+
+        # Limits/guards
+        self.min_temp_c: float = 10.0
+        self.max_temp_c: float = 40.0
+
+    def set_infil(self, infil_ua_kw_per_c) -> None:
+        """Update infiltration UA (kW/°C), scalar or per zone."""
+        self.infil_ua_kw_per_c[:] = infil_ua_kw_per_c
+        self._ua_total = self.ua_kw_per_c + self.infil_ua_kw_per_c
+
+    def step(self, dt: float, q_cool_kw=0.0) -> None:
+        """
+        Advance all zones by dt seconds.
+
+        Args:
+            dt: Time step in seconds
+            q_cool_kw: Cooling power per zone (kW), scalar or shape (N,)
+        """
+        q_envelope_kw = self._ua_total * (self.temp_c - self.ambient_temp_c)
+        q_net_kw = self.it_load_kw - q_cool_kw - q_envelope_kw
+        self.temp_c += q_net_kw * self._k_mass * dt
+        np.clip(self.temp_c, self.min_temp_c, self.max_temp_c, out=self.temp_c)
+
+        dt_hours = dt / 3600.0
+        self.cooling_energy_kwh += np.multiply(q_cool_kw, dt_hours)
+        self.server_energy_kwh += self.it_load_kw * dt_hours
+
+        self.time_s += dt
+
+    def get_state(self) -> dict:
+        """Return per-zone state arrays (copies) for telemetry/logging."""
+        return {
+            'temp_c': self.temp_c.copy(),
+            'ambient_temp_c': self.ambient_temp_c.copy(),
+            'it_load_kw': self.it_load_kw.copy(),
+            'infil_ua_kw_per_c': self.infil_ua_kw_per_c.copy(),
+            'time_s': self.time_s,
+            'cooling_energy_kwh': self.cooling_energy_kwh.copy(),
+            'server_energy_kwh': self.server_energy_kwh.copy(),
+            'thermal_mass_kj_per_c': self.thermal_mass_kj_per_c.copy(),
+            'ua_kw_per_c': self.ua_kw_per_c.copy()
+        }
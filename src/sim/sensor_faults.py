@@ -14,15 +14,21 @@ Engineering Implementation:
 - Configurable fault parameters
 - Multiple fault types can occur simultaneously
 - Professional fault injection for testing scenarios
+- Vectorized FaultBank / SensorArray kernels for large sensor populations
 """
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Sequence, Mapping, Type
+from types import MappingProxyType
 from enum import Enum
-import random
 import math
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+# Number of pre-generated random samples per refill
+RANDOM_BLOCK_SIZE = 4096
+
 
 class SensorFaultType(Enum):
     """Types of sensor faults that can be simulated."""
@@ -35,7 +41,7 @@ class SensorFaultType(Enum):
     SCALING_ERROR = "scaling"          # Incorrect engineering unit conversion
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorFaultConfig:
     """Configuration for individual sensor fault parameters."""
     fault_type: SensorFaultType
@@ -70,29 +76,63 @@ class SensorFaultConfig:
 
 
 class SensorFault(ABC):
-    """Abstract base class for sensor fault implementations."""
+    """
+    Abstract base class for sensor fault implementations.
+    
+    The fault configuration is frozen after construction: subclasses copy
+    the fields they use per tick into instance attributes in ``__init__``,
+    so later changes to ``config`` do not affect a running fault.
+    """
+    
+    __slots__ = ('config', 'active', 'start_time', 'accumulated_drift',
+                 '_rng', '_uniforms', '_ui', '_owner', '_severity', '_progression')
     
     def __init__(self, config: SensorFaultConfig, seed: Optional[int] = None):
         self.config = config
         self.active = False
         self.start_time: Optional[float] = None
         self.accumulated_drift = 0.0
-        self.random = random.Random(seed)
+        self._owner: Optional[TemperatureSensor] = None
+        self._severity = config.severity
+        self._progression = config.progression_rate
+        
+        # PCG64 generator; uniform draws are consumed from a block that is
+        # filled on first use and refilled when exhausted
+        self._rng = np.random.default_rng(seed)
+        self._uniforms: Optional[np.ndarray] = None
+        self._ui = RANDOM_BLOCK_SIZE
         
     @abstractmethod
     def apply_fault(self, true_value: float, sim_time: float) -> float:
         """Apply fault to sensor reading."""
         pass
     
+    def _random(self) -> float:
+        """Next uniform sample in [0, 1) from the pre-generated block."""
+        if self._ui >= RANDOM_BLOCK_SIZE:
+            self._uniforms = self._rng.random(RANDOM_BLOCK_SIZE)
+            self._ui = 0
+        u = self._uniforms[self._ui]
+        self._ui += 1
+        return float(u)
+    
+    def _uniform(self, low: float, high: float) -> float:
+        """Next uniform sample in [low, high)."""
+        return low + (high - low) * self._random()
+    
     def activate(self, sim_time: float) -> None:
         """Activate the fault at specified time."""
         self.active = True
         self.start_time = sim_time
+        if self._owner is not None:
+            self._owner._on_fault_state_change()
         
     def deactivate(self) -> None:
         """Deactivate the fault (simulate repair)."""
         self.active = False
         self.start_time = None
+        if self._owner is not None:
+            self._owner._on_fault_state_change()
         
     def get_fault_state(self) -> Dict[str, Any]:
         """Get current fault state for diagnostics."""
@@ -108,53 +148,70 @@ class SensorFault(ABC):
 class DriftFault(SensorFault):
     """Sensor drift fault - gradual accuracy degradation over time."""
     
+    __slots__ = ('_drift_coef', '_max_drift', '_sign')
+    
+    def __init__(self, config: SensorFaultConfig, seed: Optional[int] = None):
+        super().__init__(config, seed)
+        # Drift per sqrt(hour), scaled by progression and severity
+        self._drift_coef = (config.drift_rate_per_hour *
+                            self._progression *
+                            self._severity)
+        self._max_drift = config.max_drift
+        self._sign = 1.0
+        
+    def activate(self, sim_time: float) -> None:
+        """Activate the fault and fix the drift direction for this episode."""
+        self._sign = 1.0 if self._random() > 0.5 else -1.0
+        super().activate(sim_time)
+        
     def apply_fault(self, true_value: float, sim_time: float) -> float:
         if not self.active or self.start_time is None:
             return true_value
             
-        # Calculate elapsed time in hours
+        # Non-linear progression (square root for realistic drift), limited
+        # to max_drift; elapsed time clamped at zero before the sqrt
         elapsed_hours = (sim_time - self.start_time) / 3600.0
-        
-        # Calculate cumulative drift
-        drift_increment = (self.config.drift_rate_per_hour * 
-                          self.config.progression_rate * 
-                          self.config.severity)
-        
-        # Apply non-linear progression (square root for realistic drift)
-        time_factor = math.sqrt(elapsed_hours) if elapsed_hours > 0 else 0
-        total_drift = drift_increment * time_factor
-        
-        # Limit maximum drift
-        total_drift = min(total_drift, self.config.max_drift)
+        total_drift = min(self._drift_coef * math.sqrt(max(elapsed_hours, 0.0)),
+                          self._max_drift)
         
         self.accumulated_drift = total_drift
         
-        # Add random direction for drift
-        drift_direction = 1 if self.random.random() > 0.5 else -1
-        
-        return true_value + (total_drift * drift_direction)
+        return true_value + total_drift * self._sign
 
 
 class BiasFault(SensorFault):
     """Sensor bias fault - systematic offset error."""
     
+    __slots__ = ('_bias',)
+    
+    def __init__(self, config: SensorFaultConfig, seed: Optional[int] = None):
+        super().__init__(config, seed)
+        self._bias = config.bias_offset * self._severity
+        
     def apply_fault(self, true_value: float, sim_time: float) -> float:
         if not self.active:
             return true_value
             
-        bias = self.config.bias_offset * self.config.severity
-        return true_value + bias
+        return true_value + self._bias
 
 
 class IntermittentFault(SensorFault):
     """Intermittent sensor fault - random dropouts and bad readings."""
     
+    __slots__ = ('in_dropout', 'dropout_end_time', 'last_good_value',
+                 '_dropout_prob', '_dropout_duration_s', '_bad_min', '_bad_max')
+    
     def __init__(self, config: SensorFaultConfig, seed: Optional[int] = None):
         super().__init__(config, seed)
         self.in_dropout = False
         self.dropout_end_time = 0.0
         self.last_good_value = 0.0
         
+        self._dropout_prob = (config.dropout_probability *
+                              self._severity * self._progression)
+        self._dropout_duration_s = config.dropout_duration_s
+        self._bad_min, self._bad_max = config.bad_reading_range
+        
     def apply_fault(self, true_value: float, sim_time: float) -> float:
         if not self.active:
             return true_value
@@ -165,24 +222,18 @@ class IntermittentFault(SensorFault):
                 self.in_dropout = False
             else:
                 # Return bad reading during dropout
-                min_val, max_val = self.config.bad_reading_range
-                return self.random.uniform(min_val, max_val)
+                return self._uniform(self._bad_min, self._bad_max)
         
         # Check for new dropout event
-        dropout_prob = (self.config.dropout_probability * 
-                       self.config.severity * 
-                       self.config.progression_rate)
-        
-        if self.random.random() < dropout_prob:
+        if self._random() < self._dropout_prob:
             self.in_dropout = True
-            duration_variation = self.random.uniform(0.5, 2.0)
+            duration_variation = self._uniform(0.5, 2.0)
             self.dropout_end_time = (sim_time + 
-                                   self.config.dropout_duration_s * 
+                                   self._dropout_duration_s * 
                                    duration_variation)
             
             # Return bad reading
-            min_val, max_val = self.config.bad_reading_range
-            return self.random.uniform(min_val, max_val)
+            return self._uniform(self._bad_min, self._bad_max)
         
         # Store good value for potential use
         self.last_good_value = true_value
@@ -192,19 +243,32 @@ class IntermittentFault(SensorFault):
 class StuckFault(SensorFault):
     """Stuck sensor fault - sensor frozen at specific value."""
     
+    __slots__ = ('stuck_at_value', '_stuck_value')
+    
     def __init__(self, config: SensorFaultConfig, seed: Optional[int] = None):
         super().__init__(config, seed)
         self.stuck_at_value: Optional[float] = None
+        self._stuck_value = config.stuck_value
+        
+    def activate(self, sim_time: float) -> None:
+        """Activate the fault and freeze at the configured or last reading."""
+        if self._stuck_value is not None:
+            self.stuck_at_value = self._stuck_value
+        elif self._owner is not None and self._owner.has_reading:
+            self.stuck_at_value = self._owner.filtered_value
+        else:
+            # No reading yet: apply_fault latches the first value seen
+            self.stuck_at_value = None
+        super().activate(sim_time)
         
     def apply_fault(self, true_value: float, sim_time: float) -> float:
         if not self.active:
             return true_value
             
-        # Set stuck value on first activation
+        # Standalone faults (or faults injected before the owning sensor's
+        # first update) latch the first value seen
         if self.stuck_at_value is None:
-            self.stuck_at_value = (self.config.stuck_value 
-                                 if self.config.stuck_value is not None 
-                                 else true_value)
+            self.stuck_at_value = true_value
         
         return self.stuck_at_value
 
@@ -212,6 +276,14 @@ class StuckFault(SensorFault):
 class CalibrationDriftFault(SensorFault):
     """Calibration drift fault - gain and offset changes over time."""
     
+    __slots__ = ('_gain_per_hr', '_offset_per_hr')
+    
+    def __init__(self, config: SensorFaultConfig, seed: Optional[int] = None):
+        super().__init__(config, seed)
+        # Severity-scaled drift rates are constant for the fault's life
+        self._gain_per_hr = config.gain_drift_rate * self._severity
+        self._offset_per_hr = config.offset_drift_rate * self._severity
+        
     def apply_fault(self, true_value: float, sim_time: float) -> float:
         if not self.active or self.start_time is None:
             return true_value
@@ -219,36 +291,40 @@ class CalibrationDriftFault(SensorFault):
         # Calculate elapsed time in hours
         elapsed_hours = (sim_time - self.start_time) / 3600.0
         
-        # Calculate gain drift (multiplicative error)
-        gain_drift = (1.0 + self.config.gain_drift_rate * 
-                     elapsed_hours * self.config.severity)
-        
-        # Calculate offset drift (additive error)
-        offset_drift = (self.config.offset_drift_rate * 
-                       elapsed_hours * self.config.severity)
-        
-        # Apply calibration errors
-        return (true_value * gain_drift) + offset_drift
+        # Apply gain drift (multiplicative) and offset drift (additive)
+        return (true_value * (1.0 + self._gain_per_hr * elapsed_hours) +
+                self._offset_per_hr * elapsed_hours)
 
 
 class NoiseFault(SensorFault):
     """Electronic noise injection fault."""
     
+    __slots__ = ('last_noise_time', 'current_noise', '_noise_scale',
+                 '_noise_interval', '_block', '_bi')
+    
     def __init__(self, config: SensorFaultConfig, seed: Optional[int] = None):
         super().__init__(config, seed)
         self.last_noise_time = 0.0
         self.current_noise = 0.0
         
+        # Gaussian noise is drawn in blocks and consumed one sample per update
+        self._noise_scale = config.noise_amplitude * self._severity
+        self._noise_interval = 1.0 / config.noise_frequency
+        self._block: Optional[np.ndarray] = None
+        self._bi = RANDOM_BLOCK_SIZE
+        
     def apply_fault(self, true_value: float, sim_time: float) -> float:
         if not self.active:
             return true_value
             
         # Update noise at specified frequency
-        noise_interval = 1.0 / self.config.noise_frequency
-        if sim_time - self.last_noise_time >= noise_interval:
-            # Generate Gaussian noise
-            self.current_noise = (self.random.gauss(0, self.config.noise_amplitude) * 
-                                self.config.severity)
+        if sim_time - self.last_noise_time >= self._noise_interval:
+            if self._bi >= RANDOM_BLOCK_SIZE:
+                self._block = (self._rng.standard_normal(RANDOM_BLOCK_SIZE) *
+                               self._noise_scale)
+                self._bi = 0
+            self.current_noise = float(self._block[self._bi])
+            self._bi += 1
             self.last_noise_time = sim_time
             
         return true_value + self.current_noise
@@ -257,15 +333,32 @@ class NoiseFault(SensorFault):
 class ScalingErrorFault(SensorFault):
     """Scaling error fault - incorrect engineering unit conversion."""
     
+    __slots__ = ('_scale',)
+    
+    def __init__(self, config: SensorFaultConfig, seed: Optional[int] = None):
+        super().__init__(config, seed)
+        self._scale = 1.0 + config.scale_factor_error * self._severity
+        
     def apply_fault(self, true_value: float, sim_time: float) -> float:
         if not self.active:
             return true_value
             
-        scale_factor = 1.0 + (self.config.scale_factor_error * self.config.severity)
-        return true_value * scale_factor
+        return true_value * self._scale
 
 
-@dataclass
+# Fault type -> implementation (read-only)
+FAULT_CLASSES: Mapping[SensorFaultType, Type[SensorFault]] = MappingProxyType({
+    SensorFaultType.DRIFT: DriftFault,
+    SensorFaultType.BIAS: BiasFault,
+    SensorFaultType.INTERMITTENT: IntermittentFault,
+    SensorFaultType.STUCK: StuckFault,
+    SensorFaultType.CALIBRATION_DRIFT: CalibrationDriftFault,
+    SensorFaultType.NOISE: NoiseFault,
+    SensorFaultType.SCALING_ERROR: ScalingErrorFault
+})
+
+
+@dataclass(slots=True)
 class SensorConfig:
     """Configuration for a sensor with fault simulation capabilities."""
     sensor_id: str
@@ -275,7 +368,7 @@ class SensorConfig:
     accuracy: float = 0.1               # Sensor accuracy (±°C)
     response_time_s: float = 30.0       # Sensor response time constant
     
-    # Fault simulation parameters
+    # Fault simulation parameters (faults are never applied when disabled)
     enable_faults: bool = True
     fault_configs: List[SensorFaultConfig] = field(default_factory=list)
 
@@ -296,6 +389,10 @@ class TemperatureSensor:
     - Multiple fault types can be active simultaneously
     """
     
+    # Field order written by get_state_compact()
+    STATE_FIELDS = ('true_value', 'raw_value', 'filtered_value',
+                    'last_reading_time')
+    
     def __init__(self, config: SensorConfig, seed: Optional[int] = None):
         self.config = config
         self.sensor_id = config.sensor_id
@@ -311,35 +408,49 @@ class TemperatureSensor:
         # Fault simulation
         self.faults: List[SensorFault] = []
         self.fault_history: List[Dict] = []
+        self._active_faults: List[SensorFault] = []
+        
+        # Quantization step from sensor accuracy (0 disables quantization)
+        self._quant = config.accuracy / 2.0 if config.accuracy > 0 else 0.0
+        self._inv_quant = 1.0 / self._quant if self._quant else 0.0
         
         # Random seed for deterministic testing
-        self._random = random.Random(seed)
+        self._rng = np.random.default_rng(seed)
         
         # Initialize fault objects
         self._initialize_faults(seed)
         
         # Diagnostics
         self.last_reading_time = 0.0
-        self.reading_history: List[float] = []
+        self.has_reading = False            # Set by the first update()
         self.max_history = 100
         
+        # Reading history ring buffer (oldest overwritten once full)
+        self._hist = np.empty(self.max_history, dtype=np.float64)
+        self._hidx = 0
+        self._hfilled = 0
+        
     def _initialize_faults(self, seed: Optional[int]) -> None:
         """Initialize fault objects from configuration."""
-        fault_classes = {
-            SensorFaultType.DRIFT: DriftFault,
-            SensorFaultType.BIAS: BiasFault,
-            SensorFaultType.INTERMITTENT: IntermittentFault,
-            SensorFaultType.STUCK: StuckFault,
-            SensorFaultType.CALIBRATION_DRIFT: CalibrationDriftFault,
-            SensorFaultType.NOISE: NoiseFault,
-            SensorFaultType.SCALING_ERROR: ScalingErrorFault
-        }
-        
         for fault_config in self.config.fault_configs:
-            fault_class = fault_classes.get(fault_config.fault_type)
+            fault_class = FAULT_CLASSES.get(fault_config.fault_type)
             if fault_class:
                 fault_obj = fault_class(fault_config, seed)
-                self.faults.append(fault_obj)
+                self._add_fault(fault_obj)
+    
+    def _add_fault(self, fault: SensorFault) -> None:
+        """Attach a fault object so its state changes are tracked."""
+        fault._owner = self
+        self.faults.append(fault)
+        self._on_fault_state_change()
+    
+    def _on_fault_state_change(self) -> None:
+        """Rebuild the active fault list (config order) after (de)activation."""
+        if not self.config.enable_faults:
+            # Faults disabled: update() takes the nominal path only
+            self._active_faults = []
+            return
+        self._active_faults = [fault for fault in self.faults if fault.active]
     
     def update(self, true_temperature: float, dt: float, sim_time: float) -> None:
         """
@@ -359,24 +470,42 @@ class TemperatureSensor:
         else:
             self.raw_value = true_temperature
         
-        # Apply all active faults
+        # Apply all active faults (list is empty when faults are disabled)
         faulted_value = self.raw_value
-        for fault in self.faults:
-            if fault.active:
+        if self._active_faults:
+            for fault in self._active_faults:
                 faulted_value = fault.apply_fault(faulted_value, sim_time)
         
         # Apply sensor accuracy limitations
-        if self.config.accuracy > 0:
-            quantization = self.config.accuracy / 2.0
-            faulted_value = round(faulted_value / quantization) * quantization
+        if self._quant:
+            faulted_value = (math.floor(faulted_value * self._inv_quant + 0.5) *
+                             self._quant)
         
         self.filtered_value = faulted_value
         
         # Update diagnostics
         self.last_reading_time = sim_time
-        self.reading_history.append(self.filtered_value)
-        if len(self.reading_history) > self.max_history:
-            self.reading_history.pop(0)
+        self.has_reading = True
+        self._hist[self._hidx] = self.filtered_value
+        self._hidx = (self._hidx + 1) % self.max_history
+        if self._hfilled < self.max_history:
+            self._hfilled += 1
+    
+    @property
+    def reading_history(self) -> List[float]:
+        """Recorded readings in chronological order (oldest first)."""
+        return self._recent_readings(self._hfilled)
+    
+    def _recent_readings(self, count: int) -> List[float]:
+        """Return the last ``count`` readings, oldest first."""
+        count = min(count, self._hfilled)
+        if count == 0:
+            return []
+        start = (self._hidx - count) % self.max_history
+        if start + count <= self.max_history:
+            return self._hist[start:start + count].tolist()
+        return (self._hist[start:].tolist() +
+                self._hist[:self._hidx].tolist())
     
     def inject_fault(self, fault_type: SensorFaultType, 
                     config: Optional[SensorFaultConfig] = None,
@@ -401,21 +530,11 @@ class TemperatureSensor:
         
         # Create new fault if configuration provided
         if config is not None:
-            fault_classes = {
-                SensorFaultType.DRIFT: DriftFault,
-                SensorFaultType.BIAS: BiasFault,
-                SensorFaultType.INTERMITTENT: IntermittentFault,
-                SensorFaultType.STUCK: StuckFault,
-                SensorFaultType.CALIBRATION_DRIFT: CalibrationDriftFault,
-                SensorFaultType.NOISE: NoiseFault,
-                SensorFaultType.SCALING_ERROR: ScalingErrorFault
-            }
-            
-            fault_class = fault_classes.get(fault_type)
+            fault_class = FAULT_CLASSES.get(fault_type)
             if fault_class:
                 fault = fault_class(config)
+                self._add_fault(fault)
                 fault.activate(sim_time)
-                self.faults.append(fault)
                 self._log_fault_event("INJECTED", fault_type, sim_time)
                 return True
         
@@ -452,12 +571,25 @@ class TemperatureSensor:
             'filtered_value': self.filtered_value,
             'active_faults': [f.value for f in self.get_active_faults()],
             'fault_states': [f.get_fault_state() for f in self.faults],
-            'reading_history': self.reading_history[-10:],  # Last 10 readings
+            'reading_history': self._recent_readings(10),  # Last 10 readings
             'last_reading_time': self.last_reading_time,
             'response_time_s': self.response_time_s,
             'accuracy': self.config.accuracy
         }
     
+    def get_state_compact(self, out: np.ndarray) -> np.ndarray:
+        """
+        Write current readings into ``out`` (STATE_FIELDS order).
+        
+        Allocation-free alternative to get_sensor_state() for high-rate
+        telemetry; ``out`` is typically a row of a preallocated 2-D array.
+        """
+        out[0] = self.true_value
+        out[1] = self.raw_value
+        out[2] = self.filtered_value
+        out[3] = self.last_reading_time
+        return out
+    
     def _log_fault_event(self, event: str, fault_type: SensorFaultType, 
                         sim_time: float) -> None:
         """Log fault events for analysis."""
@@ -471,6 +603,266 @@ class TemperatureSensor:
         })
 
 
+class FaultBank:
+    """
+    Vectorized fault kernel for a population of sensors.
+
+    Stacks the fault parameters of N sensors into NumPy arrays (one row per
+    sensor) and applies every fault family in a single fused pass instead of
+    dispatching ``apply_fault`` per fault per sensor per tick.
+
+    Engineering Model (canonical fault order per row):
+        out = (raw * gain + offset + bias + drift * sign + noise) * scale
+        out = stuck_value             where stuck
+        out = bad_reading             where in dropout
+
+    Notes:
+    - ``sync()`` re-reads activation state and parameters from the sensor
+      fault objects; call it after injecting or clearing faults.
+    - The scalar ``TemperatureSensor.update`` path applies faults in
+      configuration order and remains the reference model for one sensor.
+    """
+
+    def __init__(self, sensors: Sequence[TemperatureSensor],
+                 seed: Optional[int] = None):
+        self.sensors = list(sensors)
+        self.n = len(self.sensors)
+        self._rng = np.random.default_rng(seed)
+
+        n = self.n
+        # Calibration drift (gain/offset per hour, time-dependent)
+        self.gain_rate = np.zeros(n)
+        self.offset_rate = np.zeros(n)
+        self.cal_start = np.zeros(n)
+        self.cal_on = np.zeros(n, dtype=bool)
+
+        # Constant bias and scaling
+        self.bias = np.zeros(n)
+        self.scale = np.ones(n)
+
+        # Drift (square-root progression, bounded)
+        self.drift_coef = np.zeros(n)
+        self.max_drift = np.zeros(n)
+        self.drift_start = np.zeros(n)
+        self.drift_sign = np.ones(n)
+        self.drift_on = np.zeros(n, dtype=bool)
+
+        # Noise (sample-and-hold at noise_frequency)
+        self.noise_amp = np.zeros(n)
+        self.noise_interval = np.ones(n)
+        self.noise_last = np.zeros(n)
+        self.noise_val = np.zeros(n)
+        self.noise_on = np.zeros(n, dtype=bool)
+
+        # Stuck sensor (NaN = capture on first apply)
+        self.stuck_val = np.full(n, np.nan)
+        self.stuck_on = np.zeros(n, dtype=bool)
+
+        # Intermittent dropouts
+        self.dropout_prob = np.zeros(n)
+        self.dropout_dur = np.zeros(n)
+        self.bad_lo = np.zeros(n)
+        self.bad_hi = np.zeros(n)
+        self.dropout_end = np.zeros(n)
+        self.in_dropout = np.zeros(n, dtype=bool)
+        self.dropout_on = np.zeros(n, dtype=bool)
+
+        self.sync()
+
+    def sync(self) -> None:
+        """Refresh fault parameters and activation masks from the sensors."""
+        for i, sensor in enumerate(self.sensors):
+            self.cal_on[i] = self.drift_on[i] = self.noise_on[i] = False
+            self.stuck_on[i] = self.dropout_on[i] = False
+            self.bias[i] = 0.0
+            self.scale[i] = 1.0
+            if not sensor.config.enable_faults:
+                continue
+
+            for fault in sensor.faults:
+                if not fault.active:
+                    continue
+                cfg = fault.config
+                start = fault.start_time or 0.0
+                ftype = cfg.fault_type
+
+                if ftype == SensorFaultType.CALIBRATION_DRIFT:
+                    self.cal_on[i] = True
+                    self.cal_start[i] = start
+                    self.gain_rate[i] = cfg.gain_drift_rate * cfg.severity
+                    self.offset_rate[i] = cfg.offset_drift_rate * cfg.severity
+                elif ftype == SensorFaultType.BIAS:
+                    self.bias[i] += cfg.bias_offset * cfg.severity
+                elif ftype == SensorFaultType.SCALING_ERROR:
+                    self.scale[i] *= 1.0 + cfg.scale_factor_error * cfg.severity
+                elif ftype == SensorFaultType.DRIFT:
+                    self.drift_on[i] = True
+                    self.drift_sign[i] = fault._sign
+                    self.drift_start[i] = start
+                    self.drift_coef[i] = (cfg.drift_rate_per_hour *
+                                          cfg.progression_rate * cfg.severity)
+                    self.max_drift[i] = cfg.max_drift
+                elif ftype == SensorFaultType.NOISE:
+                    self.noise_on[i] = True
+                    self.noise_amp[i] = cfg.noise_amplitude * cfg.severity
+                    self.noise_interval[i] = 1.0 / cfg.noise_frequency
+                elif ftype == SensorFaultType.STUCK:
+                    self.stuck_on[i] = True
+                    if fault.stuck_at_value is not None:
+                        self.stuck_val[i] = fault.stuck_at_value
+                elif ftype == SensorFaultType.INTERMITTENT:
+                    self.dropout_on[i] = True
+                    self.dropout_prob[i] = (cfg.dropout_probability *
+                                            cfg.severity * cfg.progression_rate)
+                    self.dropout_dur[i] = cfg.dropout_duration_s
+                    self.bad_lo[i], self.bad_hi[i] = cfg.bad_reading_range
+
+        # Reset latched state for rows whose fault is no longer active
+        self.stuck_val[~self.stuck_on] = np.nan
+        self.in_dropout &= self.dropout_on
+        self.noise_val[~self.noise_on] = 0.0
+
+    def apply(self, raw: np.ndarray, sim_time: float) -> np.ndarray:
+        """
+        Apply all active faults to a vector of raw sensor readings.
+
+        Args:
+            raw: Raw (post-lag) sensor values, shape (N,)
+            sim_time: Current simulation time (seconds)
+
+        Returns:
+            Faulted sensor values, shape (N,)
+        """
+        raw = np.asarray(raw, dtype=float)
+
+        # Calibration drift: gain/offset grow linearly with elapsed hours
+        cal_hours = np.maximum(sim_time - self.cal_start, 0.0) / 3600.0
+        cal_hours = np.where(self.cal_on, cal_hours, 0.0)
+        gain = 1.0 + self.gain_rate * cal_hours
+        offset = self.offset_rate * cal_hours
+
+        # Drift: square-root progression limited to max_drift
+        drift_hours = np.maximum(sim_time - self.drift_start, 0.0) / 3600.0
+        drift = np.minimum(self.drift_coef * np.sqrt(drift_hours), self.max_drift)
+        drift = np.where(self.drift_on, drift * self.drift_sign, 0.0)
+
+        # Noise: refresh rows whose hold interval has elapsed
+        refresh = self.noise_on & (sim_time - self.noise_last >= self.noise_interval)
+        if refresh.any():
+            self.noise_val[refresh] = (self._rng.standard_normal(refresh.sum()) *
+                                       self.noise_amp[refresh])
+            self.noise_last[refresh] = sim_time
+
+        out = (raw * gain + offset + self.bias + drift + self.noise_val) * self.scale
+
+        # Stuck: latch the current value on first application
+        if self.stuck_on.any():
+            capture = self.stuck_on & np.isnan(self.stuck_val)
+            self.stuck_val[capture] = out[capture]
+            out = np.where(self.stuck_on, self.stuck_val, out)
+
+        # Intermittent: expire old dropouts, start new ones, emit bad readings
+        if self.dropout_on.any():
+            self.in_dropout &= sim_time < self.dropout_end
+            start = (self.dropout_on & ~self.in_dropout &
+                     (self._rng.random(self.n) < self.dropout_prob))
+            if start.any():
+                variation = self._rng.uniform(0.5, 2.0, start.sum())
+                self.dropout_end[start] = sim_time + self.dropout_dur[start] * variation
+                self.in_dropout |= start
+            bad = self.bad_lo + (self.bad_hi - self.bad_lo) * self._rng.random(self.n)
+            out = np.where(self.in_dropout, bad, out)
+
+        return out
+
+
+class SensorArray:
+    """
+    Batch sensor model for large sensor populations (e.g. campus-wide BAS).
+    
+    Holds the first-order lag state of N sensors as NumPy arrays and steps
+    them together: lag response, FaultBank fault injection, and accuracy
+    quantization are each one vectorized pass per tick.
+    
+    Engineering Model (per sensor i):
+    - alpha_i = dt / (tau_i + dt), raw_i += alpha_i * (u_i - raw_i)
+    - Faults applied by FaultBank, then quantized to accuracy/2
+    """
+    
+    def __init__(self, sensors: Sequence[TemperatureSensor],
+                 seed: Optional[int] = None):
+        self.sensors = list(sensors)
+        self.n = len(self.sensors)
+        
+        self.raw = np.array([s.raw_value for s in self.sensors], dtype=float)
+        self.filtered = np.array([s.filtered_value for s in self.sensors], dtype=float)
+        self.true_values = np.array([s.true_value for s in self.sensors], dtype=float)
+        self.tau = np.array([s.response_time_s for s in self.sensors], dtype=float)
+        self.quant = np.array([s._quant for s in self.sensors], dtype=float)
+        
+        # Sensors without lag/quantization pass values through unchanged
+        self._has_lag = self.tau > 0
+        self._has_quant = self.quant > 0
+        self._inv_quant = np.where(self._has_quant,
+                                   1.0 / np.where(self._has_quant, self.quant, 1.0),
+                                   0.0)
+        
+        self.bank = FaultBank(self.sensors, seed)
+        self.last_reading_time = 0.0
+    
+    def sync(self) -> None:
+        """Refresh fault state after injecting or clearing sensor faults."""
+        self.bank.sync()
+    
+    def update_all(self, true_temperatures: np.ndarray, dt: float,
+                   sim_time: float) -> np.ndarray:
+        """
+        Update all sensor readings for one time step.
+        
+        Args:
+            true_temperatures: Actual temperature per sensor (°C), shape (N,)
+            dt: Time step (seconds)
+            sim_time: Current simulation time (seconds)
+            
+        Returns:
+            Filtered (faulted, quantized) readings, shape (N,)
+        """
+        self.true_values = np.asarray(true_temperatures, dtype=float)
+        
+        # First-order lag response
+        alpha = np.where(self._has_lag, dt / (self.tau + dt), 1.0)
+        self.raw += alpha * (self.true_values - self.raw)
+        
+        return self.apply_faults(sim_time)
+    
+    def apply_faults(self, sim_time: float) -> np.ndarray:
+        """
+        Apply faults and quantization to the current raw (post-lag) values.
+        
+        Used directly by callers that advance ``raw`` themselves (e.g. the
+        fused zone kernel in ``sim.zone``).
+        """
+        out = self.bank.apply(self.raw, sim_time)
+        
+        # Accuracy quantization
+        if self._has_quant.any():
+            quantized = np.floor(out * self._inv_quant + 0.5) * self.quant
+            out = np.where(self._has_quant, quantized, out)
+        
+        self.filtered = out
+        self.last_reading_time = sim_time
+        return out
+    
+    def write_back(self) -> None:
+        """Copy batch state onto the sensor objects for diagnostics."""
+        for i, sensor in enumerate(self.sensors):
+            sensor.true_value = float(self.true_values[i])
+            sensor.raw_value = float(self.raw[i])
+            sensor.filtered_value = float(self.filtered[i])
+            sensor.last_reading_time = self.last_reading_time
+            sensor.has_reading = True
+
+
 def create_default_sensor_configs() -> List[SensorConfig]:
     """Create default sensor configurations for data center zones."""
     configs = []
@@ -0,0 +1,104 @@
+# sim/zone.py
+"""
+Fused zone stepping: one room plus the sensors installed in it.
+
+Advances the room heat balance and every sensor's first-order lag in a
+single kernel call per tick, then applies sensor faults through the
+sensor array's FaultBank.
+
+Backends (selected with the SIM_BACKEND environment variable):
+- ``numba``: ``@njit(parallel=True)`` kernel, sensors stepped with prange
+- ``numpy``: vectorized NumPy kernel (always available)
+- ``auto`` (default): numba when installed, otherwise numpy
+"""
+from __future__ import annotations
+import os
+
+import numpy as np
+
+from sim.environment import Room
+from sim.sensor_faults import SensorArray
+
+# Numba acceleration (optional)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _zone_step_numpy(temp_c: float, ambient_c: float, it_load_kw: float,
+                     ua_total: float, k_mass: float, q_cool_kw: float,
+                     dt: float, min_temp_c: float, max_temp_c: float,
+                     raw: np.ndarray, tau: np.ndarray) -> float:
+    """Room heat balance + sensor lag (raw updated in place); returns room temp."""
+    q_net_kw = it_load_kw - q_cool_kw - ua_total * (temp_c - ambient_c)
+    temp_c = temp_c + q_net_kw * k_mass * dt
+    temp_c = max(min_temp_c, min(max_temp_c, temp_c))
+
+    alpha = np.where(tau > 0, dt / (tau + dt), 1.0)
+    raw += alpha * (temp_c - raw)
+    return temp_c
+
+
+def _zone_step_loop(temp_c, ambient_c, it_load_kw, ua_total, k_mass, q_cool_kw,
+                    dt, min_temp_c, max_temp_c, raw, tau):
+    """Loop form of _zone_step_numpy for numba compilation."""
+    q_net_kw = it_load_kw - q_cool_kw - ua_total * (temp_c - ambient_c)
+    temp_c = temp_c + q_net_kw * k_mass * dt
+    temp_c = max(min_temp_c, min(max_temp_c, temp_c))
+
+    for i in prange(raw.shape[0]):
+        if tau[i] > 0:
+            raw[i] += dt / (tau[i] + dt) * (temp_c - raw[i])
+        else:
+            raw[i] = temp_c
+    return temp_c
+
+
+SIM_BACKEND = os.environ.get("SIM_BACKEND", "auto").lower()
+
+if NUMBA_AVAILABLE and SIM_BACKEND in ("auto", "numba"):
+    zone_step_kernel = njit(parallel=True, cache=True)(_zone_step_loop)
+    ZONE_BACKEND = "numba"
+else:
+    zone_step_kernel = _zone_step_numpy
+    ZONE_BACKEND = "numpy"
+
+
+class ZoneModel:
+    """
+    A room and its sensors stepped together.
+    
+    Engineering Model:
+    - Room: same heat balance, bounds and energy integration as Room.step
+    - Sensors: each sees the room temperature through its own first-order
+      lag, then faults and quantization from the SensorArray
+    """
+    
+    def __init__(self, room: Room, sensors: SensorArray):
+        self.room = room
+        self.sensors = sensors
+    
+    def step(self, dt: float, q_cool_kw: float, sim_time: float) -> np.ndarray:
+        """
+        Advance the zone by dt seconds.
+        
+        Args:
+            dt: Time step in seconds
+            q_cool_kw: Cooling power supplied to the room (kW)
+            sim_time: Current simulation time (seconds)
+            
+        Returns:
+            Filtered sensor readings, shape (N,)
+        """
+        room = self.room
+        sensors = self.sensors
+        room.temp_c = float(zone_step_kernel(
+            room.temp_c, room.ambient_temp_c, room.it_load_kw,
+            room._ua_total, room._k_mass, q_cool_kw, dt,
+            room.min_temp_c, room.max_temp_c, sensors.raw, sensors.tau))
+        room._integrate(dt, q_cool_kw)
+        
+        sensors.true_values = np.full(sensors.n, room.temp_c)
+        return sensors.apply_faults(sim_time)
@@ -16,15 +16,206 @@ Data logged:
 - System performance metrics
 
 File format: ISO timestamp, comma-separated values
+
+Numeric columns are formatted by an ``@njit`` fixed-point kernel when numba
+is installed (SIM_BACKEND=auto|numba), otherwise with ``np.char.mod``.
 """
 from __future__ import annotations
+import atexit
 import csv
+import io
+import logging
+import math
+import operator
 import os
+import queue
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Numba acceleration (optional)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Default historian file write buffer; sized to hold a full write batch
+WRITE_BUFFER_BYTES = 64 * 1024
+
+# Queued file operations the writer thread runs before each flush
+WRITER_DRAIN_BATCH = 128
+
+# printf formats for the numeric ring columns, in header order
+_CORE_NUMERIC_FORMATS = (
+    "%.1f", "%.2f", "%.2f", "%.1f",         # sim time, setpoint, avg temp, PID
+    "%.2f", "%.2f", "%.2f",                 # PID terms
+    "%.1f", "%.1f", "%.2f",                 # system totals
+)
+_DIAG_NUMERIC_FORMATS = ("%.0f", "%.3f", "%.1f", "%.2f", "%.2f", "%.1f")
+
+# Diagnostic (key, default) pairs, in the same order as _DIAG_NUMERIC_FORMATS
+_DIAG_FIELDS = (
+    ("thermal_mass_kj_per_c", 0.0),
+    ("ua_kw_per_c", 0.0),
+    ("it_load_kw", 0.0),
+    ("pid_integral", 0.0),
+    ("pid_max_error", 0.0),
+    ("system_runtime_hours", 0.0),
+)
+
+# Alarm columns logged when alarms are disabled or no summary is supplied
+_NO_ALARM_CELLS = (0, 0, 0, "")
+
+# CRAC state fields read per unit (CRACUnit.get_state always supplies them)
+_CRAC_FIELDS = operator.itemgetter('unit_id', 'status', 'cmd_pct',
+                                   'q_cool_kw', 'power_kw', 'airflow_cfm')
+
+
+# Cells logged for an absent CRAC unit, and default ids for the logged units
+_EMPTY_CRAC_CELLS = ("", "", "0.0", "0.0", "0.0", "0.0")
+_DEFAULT_CRAC_IDS = tuple(f"CRAC-{i+1:02d}" for i in range(3))
+
+
+def _crac_values(crac: Dict, default_id: str) -> tuple:
+    """CRAC fields in _CRAC_FIELDS order, with defaults for missing keys."""
+    try:
+        return _CRAC_FIELDS(crac)
+    except KeyError:
+        return (crac.get('unit_id', default_id),
+                crac.get('status', 'off'),
+                crac.get('cmd_pct', 0.0),
+                crac.get('q_cool_kw', 0.0),
+                crac.get('power_kw', 0.0),
+                crac.get('airflow_cfm', 0.0))
+
+
+def _build_numeric_packer(include_diagnostics: bool):
+    """
+    Generate the function that stores one record's numeric columns.
+    
+    The diagnostic lookups are unrolled into the generated source only
+    when diagnostics are enabled, so the per-row path has no config branch.
+    """
+    lines = [
+        "def pack_numeric(row, sim_time, room_data, pid_output, pid_terms,",
+        "                 total_cooling, total_power, system_cop, kwargs):",
+    ]
+    if include_diagnostics:
+        lines.append("    diag_data = kwargs.get('diagnostics', {})")
+    lines += [
+        "    row[:] = (",
+        "        sim_time,",
+        "        room_data.get('setpoint_c', 0.0),",
+        "        room_data.get('avg_temp_c', 0.0),",
+        "        pid_output,",
+        "        pid_terms.get('p_term', 0.0),",
+        "        pid_terms.get('i_term', 0.0),",
+        "        pid_terms.get('d_term', 0.0),",
+        "        total_cooling,",
+        "        total_power,",
+        "        system_cop,",
+    ]
+    if include_diagnostics:
+        lines += [f"        diag_data.get({key!r}, {default!r}),"
+                  for key, default in _DIAG_FIELDS]
+    lines.append("    )")
+    
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["pack_numeric"]
+
+# Widest cell the fixed-point kernel emits (sign, 16 digits, point, separator)
+_FIXED_CELL_BYTES = 40
+
+
+def _fixed_point_cells(values, decimals):
+    """
+    Format values with ``decimals`` fixed decimals as newline-separated ASCII.
+    
+    Rounding matches printf: values whose scaled fraction is too close to .5
+    to decide from the float product (and NaN/inf/huge values) are left
+    empty and flagged in the returned mask for formatting in Python.
+    """
+    n = values.shape[0]
+    out = np.empty(n * _FIXED_CELL_BYTES, dtype=np.uint8)
+    fallback = np.zeros(n, dtype=np.bool_)
+    digits = np.empty(24, dtype=np.uint8)
+    scale = 10.0 ** decimals
+    min_chars = decimals + 2 if decimals > 0 else 1  # at least "0" / "0.x"
+    pos = 0
+    for i in range(n):
+        x = values[i]
+        scaled = abs(x) * scale
+        if not scaled < 4.0e15:
+            fallback[i] = True
+        else:
+            whole = math.floor(scaled)
+            frac = scaled - whole
+            if abs(frac - 0.5) <= scaled * 2.3e-16:
+                fallback[i] = True
+            else:
+                units = np.int64(whole) + (1 if frac > 0.5 else 0)
+                if np.signbit(x):
+                    out[pos] = 45  # '-'
+                    pos += 1
+                count = 0
+                while count < min_chars or units > 0:
+                    if count == decimals and decimals > 0:
+                        digits[count] = 46  # '.'
+                    else:
+                        digits[count] = 48 + units % 10
+                        units //= 10
+                    count += 1
+                for k in range(count - 1, -1, -1):
+                    out[pos] = digits[k]
+                    pos += 1
+        out[pos] = 10  # '\n'
+        pos += 1
+    return out[:pos], fallback
+
+
+SIM_BACKEND = os.environ.get("SIM_BACKEND", "auto").lower()
+
+if NUMBA_AVAILABLE and SIM_BACKEND in ("auto", "numba"):
+    _fixed_point_kernel = njit(cache=True)(_fixed_point_cells)
+    HISTORIAN_BACKEND = "numba"
+else:
+    _fixed_point_kernel = None
+    HISTORIAN_BACKEND = "numpy"
+
+
+def _format_numeric_column(fmt: str, decimals: int, column: np.ndarray) -> List[str]:
+    """Format one numeric ring column with a ``%.Nf`` format."""
+    if _fixed_point_kernel is None:
+        return np.char.mod(fmt, column).tolist()
+    
+    buf, fallback = _fixed_point_kernel(column, decimals)
+    cells = buf.tobytes().decode("ascii").split("\n")
+    for i in np.flatnonzero(fallback):
+        cells[i] = fmt % column[i]
+    return cells[:-1]
+
+# Characters that force a CSV field to be quoted (csv.QUOTE_MINIMAL rules)
+_CSV_SPECIAL = frozenset(',"\r\n')
+
+
+def _csv_field(value: Any) -> str:
+    """Render a free-text value as a CSV cell, quoting only when required."""
+    if value is None:
+        return ""
+    text = str(value)
+    if _CSV_SPECIAL.isdisjoint(text):
+        return text
+    return '"' + text.replace('"', '""') + '"'
+
 
 @dataclass
 class HistorianConfig:
@@ -37,6 +228,13 @@ class HistorianConfig:
     max_file_size_mb: float = 10.0          # Rotate at 10MB
     max_files: int = 100                    # Keep 100 files max
     auto_rotate: bool = True
+    write_batch_rows: int = 32              # Ring rows per file write
+    write_buffer_bytes: int = WRITE_BUFFER_BYTES  # Fixed buffer per open file
+    
+    # Background writer
+    background_writer: bool = False         # File I/O on a writer thread
+    writer_queue_size: int = 1024           # Pending row chunks before backpressure
+    drop_when_full: bool = False            # Drop chunks instead of blocking
     
     # Data options
     include_alarms: bool = True
@@ -70,14 +268,69 @@ class CSVHistorian:
         self.current_file_handle = None
         self.csv_writer = None
         self.headers_written: bool = False
+        self._headers: List[str] = []
+        self._open_path: Optional[str] = None   # File the writer has open
+        self._closed: bool = False
+        
+        # Fixed write-buffer size for every file this historian opens
+        self._write_buffer_bytes = max(io.DEFAULT_BUFFER_SIZE,
+                                       self.cfg.write_buffer_bytes)
+        
+        # Columnar ring buffer: numeric fields land in a preallocated array,
+        # free-text fields in a fixed list; a full ring is formatted column
+        # by column and written with one call
+        self._num_formats = _CORE_NUMERIC_FORMATS
+        if self.cfg.include_diagnostics:
+            self._num_formats += _DIAG_NUMERIC_FORMATS
+        self._num_decimals = tuple(int(fmt[2:-1]) for fmt in self._num_formats)
+        
+        # Column builders specialized once from the config
+        self._pack_numeric = _build_numeric_packer(self.cfg.include_diagnostics)
+        if self.cfg.include_alarms:
+            self._alarm_cells = self._build_alarm_cells
+        else:
+            self._alarm_cells = lambda alarm_data, alarm_list: _NO_ALARM_CELLS
+        self._ring_size: int = max(1, self.cfg.write_batch_rows)
+        self._ring_idx: int = 0
+        self._ring_num = np.empty((self._ring_size, len(self._num_formats)))
+        self._ring_text: List[Optional[tuple]] = [None] * self._ring_size
+        column_count = 11 + len(self._num_formats)
+        self._row_template = ",".join(["{}"] * column_count) + "\r\n"
+        
+        # Timestamp cache: whole-second part formatted once per second,
+        # microseconds (trailing %f) appended per record
+        fmt = self.cfg.timestamp_format
+        self._ts_sub_second = fmt.endswith("%f")
+        self._ts_sec_format = fmt[:-2] if self._ts_sub_second else fmt
+        self._ts_cacheable = "%f" not in self._ts_sec_format
+        self._ts_cache_sec: int = -1
+        self._ts_cache_str: str = ""
         
         # Statistics
         self.records_written: int = 0
         self.files_created: int = 0
         self.total_data_mb: float = 0.0
+        self.records_dropped: int = 0
+        self._bytes_written: int = 0            # Bytes written to current file
+        self._file_rows: int = 0                # Data rows in current file
         
         # Ensure log directory exists
         self._ensure_log_directory()
+        
+        # Writer thread: file operations are queued in order and run off the
+        # caller's thread; without it they run inline
+        self._queue: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_error: Optional[BaseException] = None
+        if self.cfg.background_writer:
+            self._queue = queue.Queue(maxsize=max(1, self.cfg.writer_queue_size))
+            self._writer_thread = threading.Thread(
+                target=self._drain, name="historian-writer", daemon=True)
+            self._writer_thread.start()
+        
+        # Rows still in the ring (or queued) are written if the process
+        # exits without close()
+        atexit.register(self.close)
     
     def _ensure_log_directory(self) -> None:
         """Create log directory if it doesn't exist."""
@@ -89,32 +342,185 @@ class CSVHistorian:
         return (sim_time - self.last_log_time) >= self.cfg.sample_interval_s
     
     def _get_new_filename(self) -> str:
-        """Generate new filename with timestamp."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{self.cfg.file_prefix}_{timestamp}.csv"
-        return os.path.join(self.cfg.base_directory, filename)
+        """
+        Generate a new filename with timestamp.
+        
+        Names have one-second resolution, so a name that already exists
+        gets a _NNN sequence suffix ("_..._HHMMSS.csv" sorts before
+        "_..._HHMMSS_001.csv", keeping name order chronological).
+        """
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
+        stem = os.path.join(self.cfg.base_directory,
+                            f"{self.cfg.file_prefix}_{timestamp}")
+        path = f"{stem}.csv"
+        seq = 0
+        while os.path.exists(path) or path == self._open_path:
+            seq += 1
+            path = f"{stem}_{seq:03d}.csv"
+        return path
+    
+    def _format_timestamp(self) -> str:
+        """Format the current wall-clock time using timestamp_format."""
+        if not self._ts_cacheable:
+            return datetime.now().strftime(self.cfg.timestamp_format)
+        
+        now = time.time()
+        sec = int(now)
+        if sec != self._ts_cache_sec:
+            self._ts_cache_sec = sec
+            self._ts_cache_str = time.strftime(self._ts_sec_format,
+                                               time.localtime(sec))
+        if self._ts_sub_second:
+            return f"{self._ts_cache_str}{int((now - sec) * 1e6):06d}"
+        return self._ts_cache_str
     
     def _should_rotate_file(self) -> bool:
-        """Check if current file should be rotated."""
-        if not self.current_file_path or not os.path.exists(self.current_file_path):
-            return True
+        """Check if a file still has to be opened (size rotation is writer-side)."""
+        return not self.current_file_path
+    
+    def _submit(self, operation, *args) -> None:
+        """Run a file operation inline, or queue it for the writer thread."""
+        if self._queue is None:
+            operation(*args)
+        elif self.cfg.drop_when_full and operation == self._write_rows:
+            try:
+                self._queue.put_nowait((operation, args))
+            except queue.Full:
+                if not self.records_dropped:
+                    logger.warning(
+                        "Historian writer queue full; dropping telemetry "
+                        "(drop_when_full=True). See records_dropped.")
+                self.records_dropped += len(args[1])
+        else:
+            self._queue.put((operation, args))
+    
+    def _drain(self) -> None:
+        """Writer thread: run queued file operations, flushing once per batch."""
+        while True:
+            item = self._queue.get()
+            stop = item is None
+            batch = [] if stop else [item]
+            while not stop and len(batch) < WRITER_DRAIN_BATCH:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+            
+            try:
+                for operation, args in batch:
+                    operation(*args)
+                self._flush_file()
+            except Exception as e:  # keep draining so producers never block
+                if self._writer_error is None:
+                    self._writer_error = e
+            
+            if stop:
+                return
+    
+    def _flush_ring(self) -> None:
+        """Hand pending ring rows to the writer and reset the ring."""
+        count = self._ring_idx
+        if count:
+            if self._queue is None:
+                self._write_rows(self._ring_num[:count], self._ring_text[:count])
+                self._flush_file()
+            else:
+                self._submit(self._write_rows, self._ring_num[:count].copy(),
+                             self._ring_text[:count])
+        self._ring_idx = 0
+    
+    def _write_rows(self, ring_num: np.ndarray, ring_text: List[tuple]) -> None:
+        """
+        Format ring rows column-wise and write them to the current file.
         
-        if self.cfg.auto_rotate:
-            file_size_mb = os.path.getsize(self.current_file_path) / (1024 * 1024)
-            return file_size_mb >= self.cfg.max_file_size_mb
+        The writer owns the byte count, so size rotation happens here: rows
+        that would take the file past max_file_size_mb go to a new file.
+        """
+        if not self.current_file_handle:
+            return
+        count = len(ring_text)
+        numeric = [_format_numeric_column(fmt, decimals, ring_num[:count, col])
+                   for col, (fmt, decimals) in enumerate(
+                       zip(self._num_formats, self._num_decimals))]
+        text = list(zip(*ring_text))
+        columns = [text[0], *numeric[:7], text[1], text[2],
+                   *numeric[7:10], *text[3:], *numeric[10:]]
+        template = self._row_template
+        rows = [template.format(*cells) for cells in zip(*columns)]
+        if not self.cfg.auto_rotate:
+            self._write_chunk("".join(rows))
+            return
         
-        return False
+        limit = self.cfg.max_file_size_mb * 1024 * 1024
+        start = 0
+        size = self._bytes_written
+        for i, row in enumerate(rows):
+            row_bytes = len(row) if row.isascii() else len(row.encode(
+                self.current_file_handle.encoding))
+            # A file always takes at least one data row, even an oversize one
+            if size + row_bytes > limit and (i > start or self._file_rows):
+                self._write_chunk("".join(rows[start:i]))
+                self._roll_over()
+                start = i
+                size = self._bytes_written
+            size += row_bytes
+        self._write_chunk("".join(rows[start:]))
+    
+    def _write_chunk(self, chunk: str) -> None:
+        """Write formatted rows to the current file and count them."""
+        if chunk:
+            self.current_file_handle.write(chunk)
+            self._count_bytes(chunk)
+            self._file_rows += chunk.count("\r\n")
+    
+    def _roll_over(self) -> None:
+        """Writer side of size rotation: continue in a new file with headers."""
+        self._flush_file()
+        self.current_file_path = self._get_new_filename()
+        self.files_created += 1
+        self._open_file(self.current_file_path)
+        self._write_header_row(self._headers)
+    
+    def _flush_file(self) -> None:
+        """Push buffered output of the current file to the OS."""
+        if self.current_file_handle:
+            self.current_file_handle.flush()
+    
+    def _count_bytes(self, text: str) -> None:
+        """Add the encoded size of text written to the current file."""
+        if text.isascii():
+            self._bytes_written += len(text)
+        else:
+            self._bytes_written += len(text.encode(self.current_file_handle.encoding))
+        self.total_data_mb = self._bytes_written / (1024 * 1024)
     
     def _rotate_file(self) -> None:
         """Close current file and open new one."""
+        self._flush_ring()
+        self.current_file_path = self._get_new_filename()
+        self.headers_written = False
+        self.files_created += 1
+        self._submit(self._open_file, self.current_file_path)
+    
+    def _open_file(self, path: str) -> None:
+        """Writer side of rotation: swap file handles and prune old files."""
         if self.current_file_handle:
             self.current_file_handle.close()
         
-        self.current_file_path = self._get_new_filename()
-        self.current_file_handle = open(self.current_file_path, 'w', newline='')
+        # Append-only descriptor: the kernel positions every write at EOF
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        raw = io.FileIO(fd, 'ab', closefd=True)
+        buffered = io.BufferedWriter(raw, buffer_size=self._write_buffer_bytes)
+        self.current_file_handle = io.TextIOWrapper(buffered, newline='',
+                                                    write_through=False)
         self.csv_writer = csv.writer(self.current_file_handle)
-        self.headers_written = False
-        self.files_created += 1
+        self._bytes_written = os.fstat(fd).st_size
+        self._file_rows = 0
+        self._open_path = path
         
         # Clean up old files if needed
         self._cleanup_old_files()
@@ -124,14 +530,22 @@ class CSVHistorian:
         if not self.cfg.auto_rotate or self.cfg.max_files <= 0:
             return
         
-        log_dir = Path(self.cfg.base_directory)
-        pattern = f"{self.cfg.file_prefix}_*.csv"
-        log_files = sorted(log_dir.glob(pattern))
+        # Names embed %Y%m%d_%H%M%S, so name order is chronological and
+        # plain dirents are enough (no Path objects or stat calls)
+        prefix = f"{self.cfg.file_prefix}_"
+        with os.scandir(self.cfg.base_directory) as entries:
+            log_files = [(entry.name, entry.path) for entry in entries
+                         if entry.name.startswith(prefix)
+                         and entry.name.endswith(".csv")]
+        
+        excess = len(log_files) - self.cfg.max_files
+        if excess <= 0:
+            return
         
-        while len(log_files) > self.cfg.max_files:
-            oldest_file = log_files.pop(0)
+        log_files.sort()
+        for _, path in log_files[:excess]:
             try:
-                oldest_file.unlink()
+                os.unlink(path)
             except OSError:
                 pass  # File might be in use
     
@@ -168,9 +582,30 @@ class CSVHistorian:
                 "pid_integral", "pid_max_error", "system_runtime_hours"
             ])
         
-        self.csv_writer.writerow(headers)
+        self._headers = headers
+        self._submit(self._write_header_row, headers)
         self.headers_written = True
     
+    def _write_header_row(self, headers: List[str]) -> None:
+        """Writer side of _write_headers."""
+        if self._bytes_written:
+            return  # Continuing a file that already has its header
+        # Header names are ASCII, so characters written equals bytes written
+        self._bytes_written += self.csv_writer.writerow(headers)
+    
+    def _build_alarm_cells(self, alarm_data: Dict,
+                           alarm_list: Optional[List[str]]) -> tuple:
+        """Alarm count and alarm list columns for one record."""
+        if not alarm_data:
+            return _NO_ALARM_CELLS
+        priority_counts = alarm_data.get('priority_breakdown', {})
+        return (
+            alarm_data.get('active_alarms', 0),
+            priority_counts.get('critical', 0),
+            priority_counts.get('high', 0),
+            _csv_field(';'.join(alarm_list)) if alarm_list else ""
+        )
+    
     def log_data(self, sim_time: float, room_data: Dict, crac_data: List[Dict],
                  alarm_data: Dict, pid_output: float, **kwargs) -> None:
         """
@@ -184,6 +619,8 @@ class CSVHistorian:
             pid_output: Current PID controller output
             **kwargs: Additional data to log (including 'pid_terms' dict)
         """
+        if self._closed:
+            raise ValueError("log_data() called on a closed historian")
         
         # Check if we should log this timestep
         if not self._should_log(sim_time):
@@ -198,115 +635,75 @@ class CSVHistorian:
             self._write_headers()
         
         # Prepare data row
-        timestamp = datetime.now().strftime(self.cfg.timestamp_format)
-        
-        # Basic control data
-        row_data = [
-            timestamp,
-            f"{sim_time:.1f}",
-            f"{room_data.get('setpoint_c', 0.0):.2f}",
-            f"{room_data.get('avg_temp_c', 0.0):.2f}",
-            f"{pid_output:.1f}"
-        ]
-        
-        # PID individual terms
-        pid_terms = kwargs.get('pid_terms', {})
-        row_data.extend([
-            f"{pid_terms.get('p_term', 0.0):.2f}",
-            f"{pid_terms.get('i_term', 0.0):.2f}",
-            f"{pid_terms.get('d_term', 0.0):.2f}"
-        ])
+        timestamp = self._format_timestamp()
         
         # Individual sensors (pad to 5)
         sensors = room_data.get('sensor_temps', [])
-        for i in range(5):
-            if i < len(sensors):
-                row_data.append(f"{sensors[i]:.2f}")
-            else:
-                row_data.append("")
+        sensor_cells = [f"{temp:.2f}" for temp in sensors[:5]]
+        sensor_cells.extend([""] * (5 - len(sensor_cells)))
         
-        # CRAC data (pad to 3 units)
+        # CRAC data (pad to 3 units); totals accumulate in the same pass
+        crac_cells = [""] * 18
+        total_cooling = total_power = 0.0
+        active_units = 0
         for i in range(3):
             if i < len(crac_data):
-                crac = crac_data[i]
-                row_data.extend([
-                    crac.get('unit_id', f'CRAC-{i+1:02d}'),
-                    crac.get('status', 'off'),
-                    f"{crac.get('cmd_pct', 0.0):.1f}",
-                    f"{crac.get('q_cool_kw', 0.0):.1f}",
-                    f"{crac.get('power_kw', 0.0):.1f}",
-                    f"{crac.get('airflow_cfm', 0.0):.0f}"
-                ])
+                unit_id, status, cmd_pct, q_cool, power, airflow = \
+                    _crac_values(crac_data[i], _DEFAULT_CRAC_IDS[i])
+                total_cooling += q_cool
+                total_power += power
+                if status == 'running':
+                    active_units += 1
+                crac_cells[6 * i:6 * i + 6] = (
+                    _csv_field(unit_id),
+                    _csv_field(status),
+                    f"{cmd_pct:.1f}",
+                    f"{q_cool:.1f}",
+                    f"{power:.1f}",
+                    f"{airflow:.0f}"
+                )
             else:
-                row_data.extend(["", "", "0.0", "0.0", "0.0", "0.0"])
+                crac_cells[6 * i:6 * i + 6] = _EMPTY_CRAC_CELLS
+        
+        # Units beyond the logged three still count toward the totals
+        for crac in crac_data[3:]:
+            _, status, _, q_cool, power, _ = _crac_values(crac, "")
+            total_cooling += q_cool
+            total_power += power
+            if status == 'running':
+                active_units += 1
         
         # System totals
-        total_cooling = sum(c.get('q_cool_kw', 0.0) for c in crac_data)
-        total_power = sum(c.get('power_kw', 0.0) for c in crac_data)
         system_cop = total_cooling / total_power if total_power > 0 else 0.0
         
-        row_data.extend([
-            f"{total_cooling:.1f}",
-            f"{total_power:.1f}",
-            f"{system_cop:.2f}"
-        ])
-        
         # Staging status
         staging_data = kwargs.get('staging_data', {})
-        active_units = sum(1 for c in crac_data if c.get('status') == 'running')
-        
-        row_data.extend([
-            staging_data.get('lead_unit', ''),
-            str(staging_data.get('lag_staged', False)),
-            str(staging_data.get('standby_staged', False)),
-            str(active_units)
-        ])
-        
-        # Alarm data
-        if self.cfg.include_alarms and alarm_data:
-            active_alarms = alarm_data.get('active_alarms', 0)
-            priority_counts = alarm_data.get('priority_breakdown', {})
-            
-            # Create alarm list string
-            active_alarm_list = kwargs.get('active_alarm_list', [])
-            alarm_list_str = ';'.join(active_alarm_list) if active_alarm_list else ""
-            
-            row_data.extend([
-                str(active_alarms),
-                str(priority_counts.get('critical', 0)),
-                str(priority_counts.get('high', 0)),
-                alarm_list_str
-            ])
-        else:
-            row_data.extend(["0", "0", "0", ""])
         
-        # Diagnostic data
-        if self.cfg.include_diagnostics:
-            diag_data = kwargs.get('diagnostics', {})
-            row_data.extend([
-                f"{diag_data.get('thermal_mass_kj_per_c', 0.0):.0f}",
-                f"{diag_data.get('ua_kw_per_c', 0.0):.3f}",
-                f"{diag_data.get('it_load_kw', 0.0):.1f}",
-                f"{diag_data.get('pid_integral', 0.0):.2f}",
-                f"{diag_data.get('pid_max_error', 0.0):.2f}",
-                f"{diag_data.get('system_runtime_hours', 0.0):.1f}"
-            ])
+        # Push the record into the ring; sensor and CRAC blocks are pre-joined
+        # because their padding cells differ from populated ones
+        idx = self._ring_idx
+        self._pack_numeric(self._ring_num[idx], sim_time, room_data, pid_output,
+                           kwargs.get('pid_terms', {}), total_cooling,
+                           total_power, system_cop, kwargs)
+        self._ring_text[idx] = (
+            timestamp,
+            ",".join(sensor_cells),
+            ",".join(crac_cells),
+            _csv_field(staging_data.get('lead_unit', '')),
+            staging_data.get('lag_staged', False),
+            staging_data.get('standby_staged', False),
+            active_units,
+            *self._alarm_cells(alarm_data, kwargs.get('active_alarm_list'))
+        )
         
-        # Write the row
-        self.csv_writer.writerow(row_data)
-        self.current_file_handle.flush()  # Ensure data is written
+        # Write the ring once full
+        self._ring_idx = idx + 1
+        if self._ring_idx >= self._ring_size:
+            self._flush_ring()
         
         # Update statistics
         self.records_written += 1
         self.last_log_time = sim_time
-        
-        # Update file size tracking
-        if self.current_file_path:
-            try:
-                file_size_mb = os.path.getsize(self.current_file_path) / (1024 * 1024)
-                self.total_data_mb = file_size_mb
-            except OSError:
-                pass
     
     def get_statistics(self) -> Dict:
         """Get historian performance statistics."""
@@ -314,6 +711,7 @@ class CSVHistorian:
             "records_written": self.records_written,
             "files_created": self.files_created,
             "total_data_mb": self.total_data_mb,
+            "records_dropped": self.records_dropped,
             "current_file": self.current_file_path,
             "sample_interval_s": self.cfg.sample_interval_s,
             "last_log_time": self.last_log_time
@@ -321,10 +719,30 @@ class CSVHistorian:
     
     def close(self) -> None:
         """Close current file and cleanup resources."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        
+        self._flush_ring()
+        if self.records_dropped:
+            logger.warning(f"Historian dropped {self.records_dropped} records "
+                           f"(writer queue full)")
+        if self._writer_thread is not None:
+            self._queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+            self._queue = None
+        
         if self.current_file_handle:
             self.current_file_handle.close()
             self.current_file_handle = None
             self.csv_writer = None
+        
+        # Surface a failure from the writer thread to the caller
+        if self._writer_error is not None:
+            error, self._writer_error = self._writer_error, None
+            raise error
 
 
 def create_test_historian() -> CSVHistorian:
@@ -12,16 +12,30 @@ Professional scenario execution framework for validating BAS control logic:
 Usage:
     python tools/run_scenario.py scenarios/rising_load.json
     python tools/run_scenario.py scenarios/crac_failure.json --historian --output results/
+    python tools/run_scenario.py scenarios/*.json   # one worker process per scenario
+    python tools/run_scenario.py scenarios/*.json --quiet   # reports only
+    python tools/run_scenario.py scenarios/rising_load.json --json-report --output results/
+
+The open-loop part of a scenario (the IT load ramp) is precomputed for every
+step by an ``@njit`` kernel when numba is installed (SIM_BACKEND=auto|numba),
+otherwise by a NumPy kernel; the closed loop (PID, sequencer, CRAC units,
+alarms) keeps its object state and is stepped in Python.
 """
 from __future__ import annotations
+import io
 import json
+import logging
 import time
 import argparse
+import contextlib
+import multiprocessing
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import sys
 import os
 
+import numpy as np
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
@@ -32,6 +46,60 @@ from control.sequences import CRACSequencer, StagingConfig
 from control.alarms import AlarmManager
 from telemetry.historian import CSVHistorian, HistorianConfig
 
+# Progress/status messages; the CLI sends them to stdout (--quiet hides them)
+logger = logging.getLogger(__name__)
+
+# Fast JSON parsing (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Numba acceleration (optional)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _ramp_schedule_numpy(total_steps: int, dt: float, start_time: float,
+                         end_time: float, start_load: float,
+                         end_load: float, inv_span: float) -> np.ndarray:
+    """IT load per step for a linear ramp; NaN before the ramp starts."""
+    sim_time = np.arange(total_steps) * dt
+    load = start_load + (sim_time - start_time) * (inv_span * (end_load - start_load))
+    load[sim_time < start_time] = np.nan
+    load[sim_time > end_time] = end_load
+    return load
+
+
+def _ramp_schedule_loop(total_steps, dt, start_time, end_time, start_load,
+                        end_load, inv_span):
+    """Loop form of _ramp_schedule_numpy for numba compilation."""
+    slope = inv_span * (end_load - start_load)
+    load = np.empty(total_steps)
+    for step in range(total_steps):
+        sim_time = step * dt
+        if sim_time < start_time:
+            load[step] = np.nan
+        elif sim_time <= end_time:
+            load[step] = start_load + (sim_time - start_time) * slope
+        else:
+            load[step] = end_load
+    return load
+
+
+SIM_BACKEND = os.environ.get("SIM_BACKEND", "auto").lower()
+
+if NUMBA_AVAILABLE and SIM_BACKEND in ("auto", "numba"):
+    ramp_schedule_kernel = njit(_ramp_schedule_loop)
+    SCENARIO_BACKEND = "numba"
+else:
+    ramp_schedule_kernel = _ramp_schedule_numpy
+    SCENARIO_BACKEND = "numpy"
+
 
 class ScenarioRunner:
     """
@@ -45,25 +113,82 @@ class ScenarioRunner:
     - Integration with historian and alarm systems
     """
     
-    def __init__(self):
+    # Per-step telemetry columns (structure of arrays)
+    TELEMETRY_DTYPES = {
+        'time_s': np.float64,
+        'temp_c': np.float64,
+        'setpoint_c': np.float64,
+        'pid_output': np.float64,
+        'total_cooling': np.float64,
+        'lag_staged': np.uint8,
+        'active_alarms': np.uint16,
+    }
+    
+    # Steps of sensor noise drawn per refill of the noise pool
+    NOISE_POOL_STEPS = 1024
+    
+    def __init__(self, run_label: Optional[str] = None):
+        # Added to historian/report file names so concurrent runs don't collide
+        self.run_label = run_label
         self.scenario_config: Dict = {}
+        # Sections of scenario_config, cached by load_scenario
+        self.scenario: Dict = {}
+        self.load_profile: Optional[Dict] = None
+        # CRAC failures as (time_s, duration_hours, ROLE), sorted by time
+        self.failure_events: List[Tuple[float, float, str]] = []
+        self.expected: Dict = {}
+        self.criteria: Dict = {}
+        self.allowed_alarms: frozenset = frozenset()
+        self.required_alarms: frozenset = frozenset()
         self.room: Optional[Room] = None
         self.pid: Optional[PIDController] = None
         self.sequencer: Optional[CRACSequencer] = None
         self.alarm_mgr: Optional[AlarmManager] = None
         self.historian: Optional[CSVHistorian] = None
         
+        # Sensor noise generator (seeded for repeatable runs)
+        self._rng = np.random.default_rng(42)
+        self._sensor_buf = np.empty(0)
+        self._noise_pool = np.empty((0, 0))
+        self._noise_idx = 0
+        self._crac_units: List[CRACUnit] = []
+        self._crac_states: List[Dict] = []
+        
         # Test results
         self.test_results: Dict = {}
-        self.telemetry_data: List[Dict] = []
+        self._telemetry: Dict[str, np.ndarray] = {}
+        self._telemetry_steps = 0
+    
+    @property
+    def telemetry_data(self) -> List[Dict]:
+        """Per-step telemetry as a list of records, built on access."""
+        columns = {name: col[:self._telemetry_steps].tolist()
+                   for name, col in self._telemetry.items()}
+        if not columns:
+            return []
+        columns['lag_staged'] = [bool(v) for v in columns['lag_staged']]
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
         
     def load_scenario(self, scenario_path: str) -> None:
         """Load scenario configuration from JSON file."""
-        with open(scenario_path, 'r') as f:
-            self.scenario_config = json.load(f)
+        with open(scenario_path, 'rb') as f:
+            raw = f.read()
+        self.scenario_config = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        self.scenario = self.scenario_config['scenario']
+        self.load_profile = self.scenario_config.get('load_profile')
+        self.failure_events = sorted(
+            (float(event['failure_time_s']), float(event['duration_hours']),
+             event['target_unit'].upper())
+            for event in self.scenario_config.get('failure_events', [])
+            if event['type'] == 'crac_failure'
+        )
+        self.expected = self.scenario_config.get('expected_behavior', {})
+        self.criteria = self.scenario_config.get('validation_criteria', {})
+        self.allowed_alarms = frozenset(self.criteria.get('alarm_tolerance', []))
+        self.required_alarms = frozenset(self.criteria.get('required_alarms', []))
         
-        print(f"📋 Loaded scenario: {self.scenario_config['scenario']['name']}")
-        print(f"   Description: {self.scenario_config['scenario']['description']}")
+        logger.info(f"📋 Loaded scenario: {self.scenario['name']}")
+        logger.info(f"   Description: {self.scenario['description']}")
     
     def setup_system(self, enable_historian: bool = False) -> None:
         """Initialize BAS system components from scenario config."""
@@ -72,6 +197,9 @@ class ScenarioRunner:
         room_cfg_data = self.scenario_config.get('room_config', {})
         room_cfg = RoomConfig(**room_cfg_data)
         self.room = Room(room_cfg)
+        self._sensor_buf = np.empty(room_cfg.n_virtual_sensors)
+        self._noise_pool = np.empty((self.NOISE_POOL_STEPS, room_cfg.n_virtual_sensors))
+        self._noise_idx = self.NOISE_POOL_STEPS  # fill on first use
         
         # PID controller (use reasonable defaults)
         pid_cfg = PIDConfig(
@@ -101,16 +229,23 @@ class ScenarioRunner:
             destaging_hysteresis=0.3
         )
         self.sequencer = CRACSequencer(cracs, staging_cfg)
+        # Assignment order and units are fixed (only roles rotate), so each
+        # unit gets one state dict that _collect_system_data refreshes
+        self._crac_units = [a.unit for a in self.sequencer.assignments]
+        self._crac_states = [{
+            'unit_id': unit.cfg.unit_id, 'status': '', 'cmd_pct': 0.0,
+            'q_cool_kw': 0.0, 'power_kw': 0.0, 'failed': False
+        } for unit in self._crac_units]
         
         # Alarm manager
         self.alarm_mgr = AlarmManager()
         
         # Initialize room at proper starting temperature
-        scenario = self.scenario_config['scenario']
+        scenario = self.scenario
         self.room.temp_c = scenario.get('initial_temp_c', 22.0)
         
         # Pre-condition system for stable operation (run setup for 10 minutes)
-        print("🔄 Pre-conditioning system to steady state...")
+        logger.info("🔄 Pre-conditioning system to steady state...")
         setup_steps = 600  # 10 minutes at 1s timestep
         for step in range(setup_steps):
             # Enable LEAD CRAC and run PID to find equilibrium
@@ -121,9 +256,9 @@ class ScenarioRunner:
             
             # Show progress every 2 minutes
             if step % 120 == 0:
-                print(f"   Setup: {step/60:.1f}m | Temp: {self.room.temp_c:.1f}°C | Cooling: {total_cooling:.1f}kW")
+                logger.info(f"   Setup: {step/60:.1f}m | Temp: {self.room.temp_c:.1f}°C | Cooling: {total_cooling:.1f}kW")
         
-        print(f"✅ System pre-conditioned: {self.room.temp_c:.1f}°C")
+        logger.info(f"✅ System pre-conditioned: {self.room.temp_c:.1f}°C")
         
         # Don't reset PID - keep the integral state for smooth transition
         
@@ -131,100 +266,157 @@ class ScenarioRunner:
         if enable_historian:
             hist_cfg = HistorianConfig(
                 base_directory="scenario_logs",
-                file_prefix=f"scenario_{int(time.time())}",
+                file_prefix=f"scenario_{self._file_tag()}",
                 sample_interval_s=5.0
             )
             self.historian = CSVHistorian(hist_cfg)
         
-        print("🔧 System components initialized")
+        logger.info("🔧 System components initialized")
     
     def execute_scenario(self) -> Dict:
         """Execute the loaded scenario and return results."""
-        scenario = self.scenario_config['scenario']
+        scenario = self.scenario
         duration_s = scenario['duration_minutes'] * 60.0
         setpoint_c = scenario['setpoint_c']
         
         dt = 1.0  # 1 second timestep
         total_steps = int(duration_s / dt)
         
-        print(f"🚀 Starting scenario execution")
-        print(f"   Duration: {scenario['duration_minutes']:.1f} minutes")
-        print(f"   Setpoint: {setpoint_c:.1f}°C")
-        print("=" * 60)
+        logger.info(f"🚀 Starting scenario execution")
+        logger.info(f"   Duration: {scenario['duration_minutes']:.1f} minutes")
+        logger.info(f"   Setpoint: {setpoint_c:.1f}°C")
+        logger.info("=" * 60)
         
         # Execution state
         start_time = time.time()
         lag_staging_time: Optional[float] = None
         max_temp_reached = self.room.temp_c
-        alarms_triggered: List[str] = []
+        alarms_triggered: Dict[str, None] = {}  # insertion-ordered set
+        
+        # IT load per step, applied from the first step of the ramp
+        load_schedule: List[float] = []
+        load_start_step = total_steps
+        ramp = self._load_schedule(total_steps, dt)
+        if ramp is not None:
+            ramp_steps = np.flatnonzero(~np.isnan(ramp))
+            if ramp_steps.size:
+                load_start_step = int(ramp_steps[0])
+            load_schedule = ramp.tolist()
+        
+        # Telemetry columns, written by step index
+        self._telemetry = {name: np.empty(total_steps, dtype=dtype)
+                           for name, dtype in self.TELEMETRY_DTYPES.items()}
+        self._telemetry_steps = 0
+        tel_time = self._telemetry['time_s']
+        tel_temp = self._telemetry['temp_c']
+        tel_setpoint = self._telemetry['setpoint_c']
+        tel_pid = self._telemetry['pid_output']
+        tel_cooling = self._telemetry['total_cooling']
+        tel_lag = self._telemetry['lag_staged']
+        tel_alarms = self._telemetry['active_alarms']
+        
+        # Historian only records every sample_interval_s; skip the other steps
+        hist_stride = 0
+        if self.historian:
+            hist_stride = max(1, int(self.historian.cfg.sample_interval_s / dt))
+        
+        # Failure events fire on the step within 0.5s of their time
+        failure_schedule = self.failure_events
+        n_failures = len(failure_schedule)
+        next_failure = 0
+        
+        # Loop-invariant bound methods
+        room = self.room
+        room_step = room.step
+        pid_update = self.pid.update
+        sequencer_update = self.sequencer.update
+        get_total_cooling = self.sequencer.get_total_cooling_kw
+        get_system_state = self.sequencer.get_system_state
+        collect_system_data = self._collect_system_data
+        alarm_update = self.alarm_mgr.update
+        get_active_alarms = self.alarm_mgr.get_active_alarms
+        show_status = logger.isEnabledFor(logging.INFO)
+        
+        # System data feeds the alarm rules every step and the historian on
+        # its sample steps; with neither, it is not built at all
+        evaluate_alarms = self.alarm_mgr.has_rules()
         
         for step in range(total_steps):
             sim_time = step * dt
             
-            # Apply dynamic load profile
-            self._apply_load_profile(sim_time)
+            # Apply dynamic load profile (Room.step reads room.it_load_kw;
+            # room.cfg keeps the configured baseline)
+            if step >= load_start_step:
+                room.it_load_kw = load_schedule[step]
             
             # Apply failure events
-            self._apply_failure_events(sim_time)
+            while (next_failure < n_failures and
+                   sim_time > failure_schedule[next_failure][0] - 0.5):
+                failure_time, duration_hours, target_role = failure_schedule[next_failure]
+                if sim_time - failure_time < 0.5:
+                    self._force_failure(sim_time, duration_hours, target_role)
+                next_failure += 1
             
             # PID control
-            pid_output = self.pid.update(setpoint_c, self.room.temp_c, dt)
+            pid_output = pid_update(setpoint_c, room.temp_c, dt)
             
             # CRAC sequencer
-            self.sequencer.update(dt, setpoint_c, self.room.temp_c, pid_output)
+            sequencer_update(dt, setpoint_c, room.temp_c, pid_output)
             
             # Room thermal dynamics
-            total_cooling = self.sequencer.get_total_cooling_kw()
-            self.room.step(dt, total_cooling)
+            total_cooling = get_total_cooling()
+            room_step(dt, total_cooling)
             
             # Update alarms
-            system_data = self._collect_system_data(sim_time, setpoint_c, pid_output)
-            self.alarm_mgr.update(sim_time, system_data)
+            log_step = hist_stride and step % hist_stride == 0
+            if evaluate_alarms or log_step:
+                system_data = collect_system_data(sim_time, setpoint_c, pid_output)
+            if evaluate_alarms:
+                alarm_update(sim_time, system_data)
             
             # Track key metrics
-            max_temp_reached = max(max_temp_reached, self.room.temp_c)
+            if room.temp_c > max_temp_reached:
+                max_temp_reached = room.temp_c
             
             # Check for LAG staging
             if lag_staging_time is None:
-                system_state = self.sequencer.get_system_state()
+                system_state = get_system_state()
                 if system_state['lag_staged']:
                     lag_staging_time = sim_time
             
             # Track active alarms
-            active_alarms = self.alarm_mgr.get_active_alarms()
+            active_alarms = get_active_alarms()
             for alarm in active_alarms:
-                if alarm.config.alarm_id not in alarms_triggered:
-                    alarms_triggered.append(alarm.config.alarm_id)
+                alarms_triggered[alarm.config.alarm_id] = None
             
             # Log to historian
-            if self.historian:
+            if log_step:
                 self._log_telemetry(sim_time, setpoint_c, pid_output, system_data)
             
             # Collect telemetry
-            self.telemetry_data.append({
-                'time_s': sim_time,
-                'temp_c': self.room.temp_c,
-                'setpoint_c': setpoint_c,
-                'pid_output': pid_output,
-                'total_cooling': total_cooling,
-                'lag_staged': system_state['lag_staged'],
-                'active_alarms': len(active_alarms)
-            })
+            tel_time[step] = sim_time
+            tel_temp[step] = room.temp_c
+            tel_setpoint[step] = setpoint_c
+            tel_pid[step] = pid_output
+            tel_cooling[step] = total_cooling
+            tel_lag[step] = system_state['lag_staged']
+            tel_alarms[step] = len(active_alarms)
+            self._telemetry_steps = step + 1
             
             # Periodic status
-            if step % 60 == 0:  # Every minute
-                temp_error = abs(self.room.temp_c - setpoint_c)
-                print(f"⏱️  {sim_time/60:5.1f}m | "
-                      f"🌡️  {self.room.temp_c:5.2f}°C | "
-                      f"❄️  {total_cooling:5.1f}kW | "
-                      f"🎯 ±{temp_error:.2f}°C | "
-                      f"🚨 {len(active_alarms)} alarms")
+            if show_status and step % 60 == 0:  # Every minute
+                temp_error = abs(room.temp_c - setpoint_c)
+                logger.info(f"⏱️  {sim_time/60:5.1f}m | "
+                            f"🌡️  {room.temp_c:5.2f}°C | "
+                            f"❄️  {total_cooling:5.1f}kW | "
+                            f"🎯 ±{temp_error:.2f}°C | "
+                            f"🚨 {len(active_alarms)} alarms")
         
         execution_time = time.time() - start_time
         
         # Compile results
         results = self._validate_scenario_results(
-            lag_staging_time, max_temp_reached, alarms_triggered
+            lag_staging_time, max_temp_reached, list(alarms_triggered)
         )
         results.update({
             'execution_time_s': execution_time,
@@ -235,70 +427,64 @@ class ScenarioRunner:
         self.test_results = results
         return results
     
-    def _apply_load_profile(self, sim_time: float) -> None:
-        """Apply dynamic IT load changes based on scenario profile."""
-        load_profile = self.scenario_config.get('load_profile')
-        if not load_profile:
-            return
-        
-        if load_profile['type'] == 'ramp':
-            start_time = load_profile['start_time_s']
-            end_time = load_profile['end_time_s']
-            start_load = load_profile['start_load_kw']
-            end_load = load_profile['end_load_kw']
-            
-            if start_time <= sim_time <= end_time:
-                # Linear interpolation
-                progress = (sim_time - start_time) / (end_time - start_time)
-                current_load = start_load + progress * (end_load - start_load)
-                self.room.cfg.it_load_kw = current_load
-            elif sim_time > end_time:
-                self.room.cfg.it_load_kw = end_load
+    def _load_schedule(self, total_steps: int, dt: float) -> Optional[np.ndarray]:
+        """Precompute the IT load for every step (NaN = leave unchanged)."""
+        load_profile = self.load_profile
+        if not load_profile or load_profile['type'] != 'ramp':
+            return None
+        
+        start_time = float(load_profile['start_time_s'])
+        end_time = float(load_profile['end_time_s'])
+        span = end_time - start_time
+        inv_span = 1.0 / span if span > 0 else 0.0  # zero span: step change
+        
+        return ramp_schedule_kernel(
+            total_steps, dt, start_time, end_time,
+            float(load_profile['start_load_kw']), float(load_profile['end_load_kw']),
+            inv_span
+        )
     
-    def _apply_failure_events(self, sim_time: float) -> None:
-        """Apply equipment failure events based on scenario."""
-        failure_events = self.scenario_config.get('failure_events', [])
-        
-        for event in failure_events:
-            if event['type'] == 'crac_failure':
-                failure_time = event['failure_time_s']
-                duration_hours = event['duration_hours']
-                target_role = event['target_unit']
-                
-                if abs(sim_time - failure_time) < 0.5:  # Within 0.5s of event
-                    # Find target unit by role
-                    for assignment in self.sequencer.assignments:
-                        if assignment.role.value.upper() == target_role.upper():
-                            assignment.unit.force_failure(duration_hours)
-                            print(f"💥 Forced failure: {assignment.unit.cfg.unit_id} "
-                                  f"({target_role}) at t={sim_time:.0f}s")
-                            break
+    def _force_failure(self, sim_time: float, duration_hours: float,
+                       target_role: str) -> None:
+        """Fail the CRAC unit currently holding target_role."""
+        for assignment in self.sequencer.assignments:
+            if assignment.role.value.upper() == target_role:
+                assignment.unit.force_failure(duration_hours)
+                logger.info(f"💥 Forced failure: {assignment.unit.cfg.unit_id} "
+                            f"({target_role}) at t={sim_time:.0f}s")
+                break
     
     def _collect_system_data(self, sim_time: float, setpoint_c: float, 
                            pid_output: float) -> Dict:
-        """Collect system data for alarm evaluation."""
-        # Get CRAC states
-        crac_states = []
-        for assignment in self.sequencer.assignments:
-            crac_states.append({
-                'unit_id': assignment.unit.cfg.unit_id,
-                'status': assignment.unit.status.value,
-                'cmd_pct': assignment.unit.cmd_pct,
-                'q_cool_kw': assignment.unit.q_cool_kw,
-                'power_kw': assignment.unit.power_kw,
-                'failed': assignment.unit.failed
-            })
-        
-        # Room sensors (simulate multiple sensors with small variance)
-        import random
-        base_temp = self.room.temp_c
-        sensor_temps = [
-            base_temp + random.uniform(-0.2, 0.2) 
-            for _ in range(self.room.cfg.n_virtual_sensors)
-        ]
+        """
+        Collect system data for alarm evaluation.
+        
+        The CRAC state dicts are reused between calls; consumers must not
+        keep references past the current step.
+        """
+        # Refresh CRAC states in place
+        crac_states = self._crac_states
+        for state, unit in zip(crac_states, self._crac_units):
+            state['status'] = unit.status.value
+            state['cmd_pct'] = unit.cmd_pct
+            state['q_cool_kw'] = unit.q_cool_kw
+            state['power_kw'] = unit.power_kw
+            state['failed'] = unit.failed
+        
+        # Room sensors (simulate multiple sensors with ±0.2°C variance);
+        # alarms and historian take a list
+        room_temp_c = self.room.temp_c
+        if self._noise_idx == self.NOISE_POOL_STEPS:
+            self._rng.random(out=self._noise_pool)
+            self._noise_pool *= 0.4
+            self._noise_idx = 0
+        noise = np.add(self._noise_pool[self._noise_idx], room_temp_c - 0.2,
+                       out=self._sensor_buf)
+        self._noise_idx += 1
+        sensor_temps = noise.tolist()
         
         return {
-            'avg_temp': self.room.temp_c,
+            'avg_temp': room_temp_c,
             'setpoint': setpoint_c,
             'sensor_temps': sensor_temps,
             'crac_states': crac_states,
@@ -351,9 +537,9 @@ class ScenarioRunner:
     def _validate_scenario_results(self, lag_staging_time: Optional[float],
                                  max_temp: float, alarms: List[str]) -> Dict:
         """Validate scenario results against expected criteria."""
-        scenario = self.scenario_config['scenario']
-        expected = self.scenario_config.get('expected_behavior', {})
-        criteria = self.scenario_config.get('validation_criteria', {})
+        scenario = self.scenario
+        expected = self.expected
+        criteria = self.criteria
         
         results = {
             'scenario_name': scenario['name'],
@@ -388,8 +574,8 @@ class ScenarioRunner:
             }
         
         # Alarm validation
-        allowed_alarms = set(criteria.get('alarm_tolerance', []))
-        required_alarms = set(criteria.get('required_alarms', []))
+        allowed_alarms = self.allowed_alarms
+        required_alarms = self.required_alarms
         triggered_alarms = set(alarms)
         
         unexpected_alarms = triggered_alarms - allowed_alarms - required_alarms
@@ -467,38 +653,76 @@ class ScenarioRunner:
         # Save to file if output directory specified
         if output_dir:
             Path(output_dir).mkdir(parents=True, exist_ok=True)
-            timestamp = int(time.time())
-            report_file = Path(output_dir) / f"scenario_report_{timestamp}.txt"
-            report_file.write_text(report)
-            print(f"📊 Report saved to: {report_file}")
+            report_file = Path(output_dir) / f"scenario_report_{self._file_tag()}.txt"
+            report_file.write_bytes(report.encode('utf-8'))
+            logger.info(f"📊 Report saved to: {report_file}")
         
         return report
     
+    def save_json_report(self, output_dir: str) -> Path:
+        """Write test_results as indented JSON; returns the file path."""
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(self.test_results, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self.test_results, indent=2).encode('utf-8')
+        
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        report_file = Path(output_dir) / f"scenario_report_{self._file_tag()}.json"
+        report_file.write_bytes(payload)
+        logger.info(f"📊 JSON report saved to: {report_file}")
+        return report_file
+    
+    def _file_tag(self) -> str:
+        """Timestamp (prefixed by run_label, if any) for output file names."""
+        timestamp = int(time.time())
+        return f"{self.run_label}_{timestamp}" if self.run_label else str(timestamp)
+    
     def cleanup(self) -> None:
         """Clean up resources."""
         if self.historian:
             self.historian.close()
 
 
-def main():
-    parser = argparse.ArgumentParser(description='Run BAS scenario tests')
-    parser.add_argument('scenario_file', help='Path to scenario JSON file')
-    parser.add_argument('--historian', action='store_true', 
-                       help='Enable CSV historian logging')
-    parser.add_argument('--output', help='Output directory for reports')
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler bound to whatever sys.stdout is at emit time."""
     
-    args = parser.parse_args()
+    def __init__(self):
+        super().__init__(sys.stdout)
+    
+    @property
+    def stream(self):
+        return sys.stdout
     
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def configure_logging(quiet: bool = False) -> None:
+    """Send progress messages to stdout, or only warnings when quiet."""
+    if not logger.handlers:
+        handler = _StdoutHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+
+
+def run_scenario_file(scenario_file: str, enable_historian: bool = False,
+                      output_dir: Optional[str] = None,
+                      run_label: Optional[str] = None,
+                      json_report: bool = False) -> int:
+    """Run one scenario file end to end; returns the process exit code."""
     # Validate scenario file exists
-    if not Path(args.scenario_file).exists():
-        print(f"❌ Scenario file not found: {args.scenario_file}")
+    if not Path(scenario_file).exists():
+        print(f"❌ Scenario file not found: {scenario_file}")
         return 1
     
     try:
         # Initialize and run scenario
-        runner = ScenarioRunner()
-        runner.load_scenario(args.scenario_file)
-        runner.setup_system(enable_historian=args.historian)
+        runner = ScenarioRunner(run_label)
+        runner.load_scenario(scenario_file)
+        runner.setup_system(enable_historian=enable_historian)
         
         # Execute scenario
         results = runner.execute_scenario()
@@ -506,8 +730,10 @@ def main():
         print("\n" + "=" * 60)
         
         # Generate and display report
-        report = runner.generate_report(args.output)
+        report = runner.generate_report(output_dir)
         print(report)
+        if json_report:
+            runner.save_json_report(output_dir or '.')
         
         # Cleanup
         runner.cleanup()
@@ -520,5 +746,64 @@ def main():
         return 1
 
 
+def _run_one(task: Tuple[str, bool, Optional[str], bool, bool]) -> Tuple[int, str]:
+    """Pool worker: run one scenario, return (exit code, captured output)."""
+    scenario_file, enable_historian, output_dir, quiet, json_report = task
+    configure_logging(quiet)
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        code = run_scenario_file(scenario_file, enable_historian, output_dir,
+                                 run_label=Path(scenario_file).stem,
+                                 json_report=json_report)
+    return code, buf.getvalue()
+
+
+def run_many(scenario_files: List[str], enable_historian: bool = False,
+             output_dir: Optional[str] = None, quiet: bool = False,
+             json_report: bool = False) -> int:
+    """
+    Run independent scenarios in parallel worker processes.
+    
+    Each scenario's output is printed in argument order once all have
+    finished. Returns 0 only if every scenario passed.
+    """
+    tasks = [(path, enable_historian, output_dir, quiet, json_report)
+             for path in scenario_files]
+    processes = min(len(tasks), os.cpu_count() or 1)
+    with multiprocessing.Pool(processes=processes) as pool:
+        outcomes = pool.map(_run_one, tasks)
+    
+    for code, output in outcomes:
+        print(output, end='')
+    
+    failed = [path for path, (code, _) in zip(scenario_files, outcomes) if code]
+    print(f"\n📦 {len(scenario_files) - len(failed)}/{len(scenario_files)} scenarios passed")
+    for path in failed:
+        print(f"   ❌ {path}")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run BAS scenario tests')
+    parser.add_argument('scenario_files', nargs='+', metavar='scenario_file',
+                       help='Path to scenario JSON file (several run in parallel)')
+    parser.add_argument('--historian', action='store_true', 
+                       help='Enable CSV historian logging')
+    parser.add_argument('--output', help='Output directory for reports')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Hide progress output; print only reports and errors')
+    parser.add_argument('--json-report', action='store_true',
+                       help='Also save results as JSON (to --output, default: current dir)')
+    
+    args = parser.parse_args()
+    configure_logging(args.quiet)
+    
+    if len(args.scenario_files) == 1:
+        return run_scenario_file(args.scenario_files[0], args.historian, args.output,
+                                 json_report=args.json_report)
+    return run_many(args.scenario_files, args.historian, args.output, args.quiet,
+                    args.json_report)
+
+
 if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    exit(main())
@@ -7,7 +7,10 @@ from .formatting import (
     format_airflow,
     format_power,
     format_runtime_professional,
-    format_alarm_duration
+    format_alarm_duration,
+    format_temperature_dual_batch,
+    format_airflow_batch,
+    format_power_batch
 )
 
 __all__ = [
@@ -16,5 +19,8 @@ __all__ = [
     'format_airflow',
     'format_power',
     'format_runtime_professional',
-    'format_alarm_duration'
+    'format_alarm_duration',
+    'format_temperature_dual_batch',
+    'format_airflow_batch',
+    'format_power_batch'
 ]
\ No newline at end of file
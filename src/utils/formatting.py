@@ -6,8 +6,48 @@ This module provides standard formatting functions that signal professional
 Building Automation System (BAS) engineering knowledge.
 """
 
+import math
+from functools import lru_cache
 from typing import Union
 
+import numpy as np
+
+# Zero-padded two-digit strings for the HH, MM and SS fields (00-99)
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+
+
+@lru_cache(maxsize=4096)
+def _format_time_hms_int(whole_seconds: int) -> str:
+    """HH:MM:SS for a whole number of seconds (cached)."""
+    hours, rem = divmod(whole_seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    if 0 <= hours < 100:
+        hours_str = _TWO_DIGITS[hours]
+    else:
+        hours_str = f"{hours:02d}"
+    return hours_str + ":" + _TWO_DIGITS[minutes] + ":" + _TWO_DIGITS[secs]
+
+
+@lru_cache(maxsize=2048)
+def _format_temperature_dual_cached(temp_c: float) -> str:
+    """Dual-unit temperature string for one value (cached)."""
+    temp_f = temp_c * 9/5 + 32
+    return f"{temp_c:.1f}°C ({temp_f:.1f}°F)"
+
+
+@lru_cache(maxsize=2048)
+def _format_airflow_metric_cached(cfm: float) -> str:
+    """Dual-unit airflow string for one value (cached)."""
+    l_per_s = cfm * 0.472
+    return f"{cfm:.0f} CFM ({l_per_s:.0f} L/s)"
+
+
+@lru_cache(maxsize=2048)
+def _format_power_btu_cached(kw: float) -> str:
+    """kW plus grouped BTU/hr string for one value (cached)."""
+    btu_hr = kw * 3412.14
+    return f"{kw:.1f} kW ({btu_hr:,.0f} BTU/hr)"
+
 
 def format_time_hms(seconds: float) -> str:
     """
@@ -27,10 +67,9 @@ def format_time_hms(seconds: float) -> str:
         >>> format_time_hms(45)
         '00:00:45'
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    # Fractional seconds never change the HH:MM:SS fields, so the floored
+    # value is the cache key
+    return _format_time_hms_int(math.floor(seconds))
 
 
 def format_temperature_dual(temp_c: float, show_fahrenheit: bool = True) -> str:
@@ -51,8 +90,11 @@ def format_temperature_dual(temp_c: float, show_fahrenheit: bool = True) -> str:
         '22.0°C'
     """
     if show_fahrenheit:
-        temp_f = temp_c * 9/5 + 32
-        return f"{temp_c:.1f}°C ({temp_f:.1f}°F)"
+        # -0.0 and 0.0 share a cache key but format differently
+        if temp_c == 0:
+            temp_f = temp_c * 9/5 + 32
+            return f"{temp_c:.1f}°C ({temp_f:.1f}°F)"
+        return _format_temperature_dual_cached(temp_c)
     else:
         return f"{temp_c:.1f}°C"
 
@@ -76,8 +118,10 @@ def format_airflow(cfm: float, show_metric: bool = True) -> str:
     """
     if show_metric:
         # Convert CFM to L/s: 1 CFM = 0.472 L/s
-        l_per_s = cfm * 0.472
-        return f"{cfm:.0f} CFM ({l_per_s:.0f} L/s)"
+        if cfm == 0:
+            l_per_s = cfm * 0.472
+            return f"{cfm:.0f} CFM ({l_per_s:.0f} L/s)"
+        return _format_airflow_metric_cached(cfm)
     else:
         return f"{cfm:.0f} CFM"
 
@@ -101,12 +145,74 @@ def format_power(kw: float, show_btu: bool = False) -> str:
     """
     if show_btu:
         # Convert kW to BTU/hr: 1 kW = 3412.14 BTU/hr
-        btu_hr = kw * 3412.14
-        return f"{kw:.1f} kW ({btu_hr:,.0f} BTU/hr)"
+        if kw == 0:
+            btu_hr = kw * 3412.14
+            return f"{kw:.1f} kW ({btu_hr:,.0f} BTU/hr)"
+        return _format_power_btu_cached(kw)
     else:
         return f"{kw:.1f} kW"
 
 
+def format_temperature_dual_batch(temps_c: np.ndarray,
+                                  show_fahrenheit: bool = True) -> np.ndarray:
+    """
+    Vectorized format_temperature_dual for a whole array of readings.
+    
+    Args:
+        temps_c: Temperatures in Celsius
+        show_fahrenheit: Whether to include Fahrenheit conversion
+        
+    Returns:
+        Array of formatted temperature strings (same shape as temps_c)
+    """
+    temps_c = np.asarray(temps_c, dtype=float)
+    celsius = np.char.mod("%.1f°C", temps_c)
+    if not show_fahrenheit:
+        return celsius
+    temps_f = temps_c * 9/5 + 32
+    return np.char.add(celsius, np.char.mod(" (%.1f°F)", temps_f))
+
+
+def format_airflow_batch(cfm: np.ndarray, show_metric: bool = True) -> np.ndarray:
+    """
+    Vectorized format_airflow for a whole array of airflows.
+    
+    Args:
+        cfm: Airflows in cubic feet per minute
+        show_metric: Whether to include L/s conversion
+        
+    Returns:
+        Array of formatted airflow strings (same shape as cfm)
+    """
+    cfm = np.asarray(cfm, dtype=float)
+    imperial = np.char.mod("%.0f CFM", cfm)
+    if not show_metric:
+        return imperial
+    l_per_s = cfm * 0.472
+    return np.char.add(imperial, np.char.mod(" (%.0f L/s)", l_per_s))
+
+
+def format_power_batch(kw: np.ndarray, show_btu: bool = False) -> np.ndarray:
+    """
+    Vectorized format_power for a whole array of power values.
+    
+    Args:
+        kw: Power values in kilowatts
+        show_btu: Whether to include BTU/hr conversion
+        
+    Returns:
+        Array of formatted power strings (same shape as kw)
+    """
+    kw = np.asarray(kw, dtype=float)
+    kilowatts = np.char.mod("%.1f kW", kw)
+    if not show_btu:
+        return kilowatts
+    # printf formats have no thousands separator, so BTU/hr uses format()
+    btu_hr = (kw * 3412.14).ravel().tolist()
+    btu = np.array([f" ({value:,.0f} BTU/hr)" for value in btu_hr]).reshape(kw.shape)
+    return np.char.add(kilowatts, btu)
+
+
 def format_runtime_professional(runtime_hours: float) -> str:
     """
     Format runtime in professional format showing both hours and HH:MM:SS.
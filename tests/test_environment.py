@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+RoomArray equivalence test.
+
+RoomArray must step N zones exactly like N independent Room objects,
+including load/infiltration changes, temperature bounds and energy
+integration.
+
+Usage:
+    python -m pytest tests/test_environment.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add src/ to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sim.environment import Room, RoomArray, RoomConfig
+
+
+def test_room_array_matches_rooms():
+    """Vectorized step equals per-room Room.step for every zone."""
+    cfgs = [
+        RoomConfig(),
+        RoomConfig(initial_temp_c=30.0, thermal_mass_kj_per_c=800.0, it_load_kw=120.0),
+        RoomConfig(initial_temp_c=18.0, ambient_temp_c=35.0, ua_kw_per_c=1.5,
+                   infil_ua_kw_per_c=0.4),
+        RoomConfig(initial_temp_c=12.0, thermal_mass_kj_per_c=300.0, it_load_kw=5.0),
+    ]
+    rooms = [Room(cfg) for cfg in cfgs]
+    zones = RoomArray(cfgs)
+    rng = np.random.default_rng(3)
+    hit_min = hit_max = False
+    
+    for step in range(3000):
+        # Scenario events: load steps and a door-open infiltration window
+        if step == 500:
+            loads = np.array([60.0, 10.0, 80.0, 200.0])
+            zones.it_load_kw[:] = loads
+            for room, load in zip(rooms, loads):
+                room.it_load_kw = float(load)
+        if step in (1200, 1800):
+            infil = 0.8 if step == 1200 else 0.0
+            zones.set_infil(infil)
+            for room in rooms:
+                room.set_infil(infil)
+        
+        q_cool = rng.uniform(0.0, 150.0, len(cfgs))
+        zones.step(1.0, q_cool)
+        for room, q in zip(rooms, q_cool):
+            room.step(1.0, float(q))
+        
+        np.testing.assert_array_equal(zones.temp_c, [room.temp_c for room in rooms])
+        hit_min |= bool(np.any(zones.temp_c == zones.min_temp_c))
+        hit_max |= bool(np.any(zones.temp_c == zones.max_temp_c))
+    
+    np.testing.assert_array_equal(zones.cooling_energy_kwh,
+                                  [room.cooling_energy_kwh for room in rooms])
+    np.testing.assert_array_equal(zones.server_energy_kwh,
+                                  [room.server_energy_kwh for room in rooms])
+    assert zones.time_s == rooms[0].time_s
+    
+    # The run must exercise both temperature bounds
+    assert hit_min and hit_max
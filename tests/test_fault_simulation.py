@@ -64,6 +64,102 @@ def test_sensor_faults():
     print("  ✅ Sensor fault simulation working correctly")
     return True
 
+def test_stuck_fault_before_first_update():
+    """A stuck fault injected before any reading freezes at the first reading."""
+    print("🧊 Testing stuck fault injected at t=0...")
+    
+    from sim.sensor_faults import (
+        TemperatureSensor, SensorConfig, SensorFaultConfig,
+        SensorFaultType, SensorArray
+    )
+    
+    def make_sensor(sensor_id):
+        config = SensorConfig(
+            sensor_id=sensor_id,
+            response_time_s=0.0,
+            fault_configs=[SensorFaultConfig(fault_type=SensorFaultType.STUCK)]
+        )
+        sensor = TemperatureSensor(config, seed=42)
+        sensor.inject_fault(SensorFaultType.STUCK, sim_time=0.0)
+        return sensor
+    
+    # Scalar path
+    sensor = make_sensor("STUCK_SCALAR")
+    sensor.update(27.3, 1.0, 0.0)
+    frozen = sensor.filtered_value
+    assert abs(frozen - 27.3) < 0.05, f"Stuck fault froze at {frozen}, not 27.3"
+    for step, temp in enumerate([28.0, 30.0, 21.0], start=1):
+        sensor.update(temp, 1.0, float(step))
+        assert sensor.filtered_value == frozen, "Stuck sensor reading changed"
+    
+    # Batch path
+    batch = SensorArray([make_sensor("STUCK_BATCH")])
+    readings = batch.update_all([27.3], 1.0, 0.0)
+    assert readings[0] == frozen, "Batch stuck fault froze at a different value"
+    readings = batch.update_all([30.0], 1.0, 1.0)
+    assert readings[0] == frozen, "Batch stuck sensor reading changed"
+    
+    print("  ✅ Stuck fault latches the first reading")
+
+def test_fault_bank():
+    """Test vectorized fault bank against the scalar fault pipeline."""
+    print("🧮 Testing vectorized fault bank...")
+    
+    from sim.sensor_faults import (
+        TemperatureSensor, SensorConfig, SensorFaultConfig,
+        SensorFaultType, FaultBank
+    )
+    
+    sensors = []
+    for i in range(4):
+        config = SensorConfig(
+            sensor_id=f"BANK_SENSOR_{i+1:02d}",
+            fault_configs=[
+                SensorFaultConfig(fault_type=SensorFaultType.BIAS,
+                                  bias_offset=0.5 * i),
+                SensorFaultConfig(fault_type=SensorFaultType.SCALING_ERROR,
+                                  scale_factor_error=0.01 * i)
+            ]
+        )
+        sensors.append(TemperatureSensor(config, seed=42))
+    
+    # Faults on odd sensors only
+    for sensor in sensors[1::2]:
+        sensor.inject_fault(SensorFaultType.BIAS, sim_time=0.0)
+        sensor.inject_fault(SensorFaultType.SCALING_ERROR, sim_time=0.0)
+    
+    bank = FaultBank(sensors, seed=42)
+    raw = [22.0, 22.5, 23.0, 23.5]
+    faulted = bank.apply(raw, 60.0)
+    
+    for sensor, value, result in zip(sensors, raw, faulted):
+        expected = value
+        for fault in sensor.faults:
+            expected = fault.apply_fault(expected, 60.0)
+        assert abs(result - expected) < 1e-9, "Fault bank diverged from scalar path"
+    
+    # Clearing faults and re-syncing restores nominal readings
+    for sensor in sensors:
+        sensor.clear_all_faults()
+    bank.sync()
+    assert list(bank.apply(raw, 120.0)) == raw, "Fault bank sync failed"
+    
+    # Batch sensor update matches the scalar sensor model
+    from sim.sensor_faults import SensorArray
+    scalar = [TemperatureSensor(SensorConfig(sensor_id=f"S{i}"), seed=42)
+              for i in range(3)]
+    batch = SensorArray([TemperatureSensor(SensorConfig(sensor_id=f"B{i}"), seed=42)
+                         for i in range(3)])
+    for step in range(30):
+        temps = [24.0, 26.0, 20.0]
+        for sensor, temp in zip(scalar, temps):
+            sensor.update(temp, 1.0, float(step))
+        readings = batch.update_all(temps, 1.0, float(step))
+    for sensor, reading in zip(scalar, readings):
+        assert abs(sensor.filtered_value - reading) < 1e-9, "Sensor array diverged"
+    
+    print("  ✅ Vectorized fault bank working correctly")
+
 def test_actuator_faults():
     """Test actuator fault simulation components."""
     print("🔧 Testing actuator fault simulation...")
@@ -309,6 +405,8 @@ def run_validation_tests():
     
     tests = [
         test_sensor_faults,
+        test_stuck_fault_before_first_update,
+        test_fault_bank,
         test_actuator_faults,
         test_control_faults,
         test_diagnostic_engine,
@@ -322,7 +420,8 @@ def run_validation_tests():
     
     for test in tests:
         try:
-            if test():
+            # Tests report failure by returning False or raising
+            if test() is not False:
                 passed += 1
             else:
                 failed += 1
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Historian file rotation and lifecycle tests.
+
+Rotated files must stay within max_file_size_mb and never reuse the name
+of an earlier file, even when several rotations fall in the same second.
+
+Usage:
+    python -m pytest tests/test_historian.py
+"""
+
+import csv
+import logging
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add src/ to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from telemetry.historian import CSVHistorian, HistorianConfig
+
+CAP_MB = 0.02
+N_ROWS = 3000
+
+
+def _log_rows(historian: CSVHistorian, n_rows: int) -> None:
+    """Log n_rows one-second samples of a three-CRAC system."""
+    crac_data = [
+        {'unit_id': f"CRAC-{i + 1:02d}", 'status': 'running', 'cmd_pct': 55.0,
+         'q_cool_kw': 30.0, 'power_kw': 8.5, 'airflow_cfm': 12000.0}
+        for i in range(3)
+    ]
+    alarm_data = {'active_alarms': 1, 'priority_breakdown': {'critical': 0, 'high': 1}}
+    for step in range(1, n_rows + 1):
+        room_data = {'setpoint_c': 22.0, 'avg_temp_c': 22.0 + step * 1e-4,
+                     'sensor_temps': [21.9, 22.0, 22.1]}
+        historian.log_data(
+            float(step), room_data, crac_data, alarm_data, 55.0,
+            staging_data={'lead_unit': 'CRAC-01', 'lag_staged': True},
+            active_alarm_list=['CRAC_FAIL'],
+            pid_terms={'p_term': 1.0, 'i_term': 2.0, 'd_term': 0.0}
+        )
+
+
+def _check_rotation(log_dir: Path, historian: CSVHistorian) -> None:
+    """Every file is under the cap, has one header, and no row is lost."""
+    files = sorted(log_dir.glob("rot_*.csv"))
+    assert len(files) > 1, "Expected size-based rotation"
+    assert len(files) == historian.files_created
+    
+    data_rows = 0
+    for path in files:
+        assert path.stat().st_size <= CAP_MB * 1024 * 1024, f"{path.name} over cap"
+        with open(path, newline='') as f:
+            rows = list(csv.reader(f))
+        assert rows[0][0] == "timestamp"
+        assert all(row[0] != "timestamp" for row in rows[1:])
+        data_rows += len(rows) - 1
+    assert data_rows == N_ROWS
+
+
+def _historian(log_dir: Path, background_writer: bool) -> CSVHistorian:
+    return CSVHistorian(HistorianConfig(
+        base_directory=str(log_dir), file_prefix="rot",
+        sample_interval_s=1.0, max_file_size_mb=CAP_MB, max_files=1000,
+        background_writer=background_writer
+    ))
+
+
+def test_rotation_inline_writer(tmp_path):
+    """Same-second rotations get fresh names and each file respects the cap."""
+    historian = _historian(tmp_path, background_writer=False)
+    _log_rows(historian, N_ROWS)
+    historian.close()
+    _check_rotation(tmp_path, historian)
+
+
+def test_rotation_background_writer(tmp_path):
+    """The writer thread enforces the cap however far it lags the producer."""
+    historian = _historian(tmp_path, background_writer=True)
+    _log_rows(historian, N_ROWS)
+    historian.close()
+    _check_rotation(tmp_path, historian)
+
+
+def test_log_after_close_raises(tmp_path):
+    """Rows logged after close() are rejected, not silently dropped."""
+    historian = _historian(tmp_path, background_writer=False)
+    _log_rows(historian, 10)
+    historian.close()
+    historian.close()  # closing twice is harmless
+    with pytest.raises(ValueError):
+        _log_rows(historian, 1)
+
+
+def test_drop_when_full_is_reported(tmp_path, monkeypatch, caplog):
+    """Chunks dropped on a full writer queue are counted and logged."""
+    historian = CSVHistorian(HistorianConfig(
+        base_directory=str(tmp_path), file_prefix="drop",
+        sample_interval_s=1.0, write_batch_rows=1, background_writer=True,
+        writer_queue_size=1, drop_when_full=True
+    ))
+    # Hold the writer thread in its first row write so the queue fills
+    release = threading.Event()
+    write_rows = historian._write_rows
+    
+    def blocked_write_rows(*args):
+        release.wait()
+        write_rows(*args)
+    
+    monkeypatch.setattr(historian, "_write_rows", blocked_write_rows)
+    with caplog.at_level(logging.WARNING, logger="telemetry.historian"):
+        _log_rows(historian, 10)
+        release.set()
+        historian.close()
+    
+    assert historian.records_dropped > 0
+    assert historian.get_statistics()["records_dropped"] == historian.records_dropped
+    assert any("dropped" in record.getMessage() for record in caplog.records)
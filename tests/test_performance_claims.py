@@ -4,7 +4,7 @@ Performance Claims Validation Test
 
 This test validates the performance claims stated in the README:
 - Temperature Control: 95.8% accuracy within ±0.5°C (ASHRAE TC 9.9)
-- N+1 Redundancy: <15s failover time with automatic role promotion  
+- N+1 Redundancy: <15s failover time with automatic role promotion
 - Energy Efficiency: COP 2.94 (Rising Load scenario)
 - Scenario-specific KPIs as documented
 
@@ -12,306 +12,377 @@ Test Scenarios:
 1. Baseline: 100% within ±0.5°C; Max error: 0.50°C; SD: 0.229°C
 2. Rising Load: 98.5% within ±0.5°C; COP 2.94
 3. CRAC Failure: 96.2% within ±0.5°C; Standby promoted <15s
+
+Usage:
+    python test_performance_claims.py               # run every scenario
+    python test_performance_claims.py --use-cache   # reuse runs with unchanged inputs
 """
 
-import subprocess
-import json
+from __future__ import annotations
+
+import argparse
+import contextlib
 import csv
-import tempfile
+import functools
+import hashlib
+import importlib.util
 import os
+import subprocess
 import sys
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Tuple
-import statistics
+from typing import Any, Dict, List, Optional, Tuple
 import time
 
+import numpy as np
+
+# Scenario name -> simulated duration (minutes) for the validation suite
+SCENARIO_DURATIONS = {
+    'baseline': 60.0,
+    'rising_load': 30.0,
+    'crac_failure': 20.0,
+}
+
+# Finished scenario runs (--use-cache), keyed by their inputs (see scenario_cache_key)
+SCENARIO_CACHE_DIR = Path(tempfile.gettempdir()) / "bas_sim_scenario_cache"
+CONFIG_PATH = Path("config/default.yaml")
+
+# Samples before steady state (first 5 minutes at a 1s timestep)
+STEADY_STATE_START_S = 5 * 60
+
+
+@functools.lru_cache(maxsize=1)
+def _load_simulator():
+    """Import main.py from the working directory as a library module."""
+    spec = importlib.util.spec_from_file_location("bas_main", "main.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@functools.lru_cache(maxsize=1)
+def _simulator_revision() -> str:
+    """Git commit of the simulator checkout, plus a digest of uncommitted source edits
+
+    A dirty tree ("<commit>+dirty.<digest>") keys its own cache entries, so
+    cached runs of committed code are never reported for edited code.
+    Returns 'unknown' outside a repository.
+    """
+    root = Path("main.py").resolve().parent
+    sources = ["--", "main.py", "src"]
+    try:
+        head = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=root).stdout.strip()
+        diff = subprocess.run(["git", "diff", "HEAD", *sources], capture_output=True,
+                              check=True, cwd=root).stdout
+        untracked = subprocess.run(["git", "ls-files", "--others", "--exclude-standard", "-z",
+                                    *sources], capture_output=True, text=True,
+                                   check=True, cwd=root).stdout.split("\0")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    new_sources = sorted(name for name in untracked if name.endswith(".py"))
+    if not diff and not new_sources:
+        return head
+    digest = hashlib.sha256(diff)
+    for name in new_sources:
+        digest.update(name.encode() + b"\0" + (root / name).read_bytes())
+    return f"{head}+dirty.{digest.hexdigest()[:16]}"
+
+
+def scenario_cache_key(scenario: str, duration: float) -> str:
+    """Digest of everything a scenario's output depends on: config, scenario, duration, code"""
+    digest = hashlib.sha256()
+    scenario_path = CONFIG_PATH.parent / "scenarios" / f"{scenario}.yaml"
+    for path in (CONFIG_PATH, scenario_path):
+        if path.exists():
+            digest.update(path.read_bytes())
+    digest.update(f"{scenario}\0{duration}\0{_simulator_revision()}".encode())
+    return digest.hexdigest()
+
+
 class PerformanceValidator:
-    def __init__(self):
+    def __init__(self, use_cache: bool = False):
         self.results = {}
         self.tolerance = 0.05  # 5% tolerance for floating point comparisons
-        
-    def run_scenario(self, scenario: str, duration: float = 15.0) -> Tuple[str, Dict]:
-        """Run a simulation scenario and return CSV path and results"""
+        self.use_cache = use_cache  # Reuse a cached run when its inputs are unchanged
+
+    def run_scenario(self, scenario: str, duration: float = 15.0) -> Tuple[List[Dict], Dict]:
+        """Run a simulation scenario in this process and return its rows and run info"""
+        cache_path = None
+        if self.use_cache:
+            cache_path = SCENARIO_CACHE_DIR / f"{scenario_cache_key(scenario, duration)}.csv"
+            if cache_path.exists():
+                print(f"\n♻️  Reusing cached {scenario} scenario ({duration} minutes): {cache_path}")
+                with open(cache_path, newline='') as f:
+                    rows = list(csv.DictReader(f))
+                return rows, {"stdout_log": None, "runtime": 0.0, "cached": True}
+
         print(f"\n🚀 Running {scenario} scenario ({duration} minutes)...")
-        
-        # Create temporary directory for results
-        temp_dir = tempfile.mkdtemp()
-        
-        # Run simulation with CSV export
-        cmd = [
-            sys.executable, "main.py", "run",
-            "--config", "config/default.yaml",
-            "--scenario", scenario,
-            "--set", f"simulation.duration_minutes={duration}",
-            "--export", "csv"
-        ]
-        
+        simulator = _load_simulator()
+
+        # Simulator output goes to a log file; it is only needed for debugging
+        stdout_log = Path(tempfile.mkdtemp()) / "stdout.log"
         start_time = time.time()
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=".")
-        end_time = time.time()
-        
-        # Note: Return code 1 just means performance criteria failed, not simulation failure
-        if result.returncode not in [0, 1]:
-            print(f"STDOUT: {result.stdout}")
-            print(f"STDERR: {result.stderr}")
-            print(f"Return code: {result.returncode}")
-            raise RuntimeError(f"Simulation failed with return code {result.returncode}")
-        
-        print(f"✅ Simulation completed in {end_time - start_time:.2f}s")
-        
-        # Find the generated CSV file  
-        csv_files = list(Path("reports").glob("simulation_*.csv"))
-        if not csv_files:
-            raise RuntimeError("No CSV output file found")
-        
-        csv_path = str(sorted(csv_files)[-1])  # Get most recent
-        return csv_path, {"stdout": result.stdout, "runtime": end_time - start_time}
-    
-    def analyze_csv(self, csv_path: str, setpoint: float = 22.0) -> Dict:
-        """Analyze CSV data and extract KPIs"""
-        print(f"📊 Analyzing CSV data: {csv_path}")
-        
-        data = []
-        with open(csv_path, 'r') as f:
-            reader = csv.DictReader(f)
-            data = list(reader)
-        
-        if not data:
-            raise RuntimeError("No data in CSV file")
-        
-        # Extract temperature data
-        temperatures = [float(row['temp_c']) for row in data]
-        setpoint_c = setpoint
-        
+        with open(stdout_log, 'w') as log, contextlib.redirect_stdout(log):
+            results = simulator.simulate(
+                CONFIG_PATH,
+                scenario=scenario,
+                overrides=[f"simulation.duration_minutes={duration}"]
+            )
+        runtime = time.time() - start_time
+        print(f"✅ Simulation completed in {runtime:.2f}s")
+
+        rows = results['detailed_data']
+        if cache_path is not None:
+            self._write_cache(rows, cache_path)
+        return rows, {"stdout_log": str(stdout_log), "runtime": runtime}
+
+    @staticmethod
+    def _write_cache(rows: List[Dict[str, Any]], cache_path: Path) -> None:
+        """Store a run in the same CSV layout as main.py's export"""
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        partial = cache_path.with_suffix(".partial")
+        with open(partial, 'w', newline='') as f:
+            if rows:
+                writer = csv.DictWriter(f, fieldnames=rows[0].keys())
+                writer.writeheader()
+                writer.writerows(rows)
+        os.replace(partial, cache_path)
+
+    def analyze_rows(self, rows: List[Dict], setpoint: float = 22.0) -> Dict:
+        """Extract KPIs from a run's rows (simulator dicts or cached CSV rows)"""
+        print(f"📊 Analyzing simulation data: {len(rows)} samples")
+        if not rows:
+            raise RuntimeError("No data in simulation results")
+        columns = rows[0].keys()
+
+        def column(name: str) -> np.ndarray:
+            if name not in columns:
+                return np.zeros(0)
+            return np.array([float(row[name]) for row in rows])
+
         # Calculate temperature KPIs
-        errors = [abs(temp - setpoint_c) for temp in temperatures]
-        avg_temp = statistics.mean(temperatures)
-        std_dev = statistics.stdev(temperatures) if len(temperatures) > 1 else 0
-        max_error = max(errors)
-        avg_error = statistics.mean(errors)
-        
-        # Calculate accuracy (% within ±0.5°C)
-        in_range_count = sum(1 for error in errors if error <= 0.5)
-        accuracy_pct = (in_range_count / len(errors)) * 100
-        
-        # Extract equipment data  
-        pid_outputs = [float(row['pid_output_pct']) for row in data if 'pid_output_pct' in row]
-        lag_staged_flags = [row['lag_staged'] == 'True' for row in data if 'lag_staged' in row]
-        
-        # Calculate COP (cooling output / electrical input)
-        cooling_outputs = [float(row['total_cooling_kw']) for row in data if 'total_cooling_kw' in row]
-        power_inputs = [float(row['total_power_kw']) for row in data if 'total_power_kw' in row]
-        
-        cops = [cooling/power if power > 0 else 0 for cooling, power in zip(cooling_outputs, power_inputs)]
-        avg_cop = statistics.mean(cops) if cops else 0
-        
+        temperatures = column('temp_c')
+        errors = np.abs(temperatures - setpoint)
+        in_range_count = int(np.count_nonzero(errors <= 0.5))
+        sample_count = len(temperatures)
+
+        # Calculate COP (cooling output / electrical input); no power counts as 0
+        cooling_outputs = column('total_cooling_kw')
+        power_inputs = column('total_power_kw')
+        cops = np.divide(cooling_outputs, power_inputs,
+                         out=np.zeros_like(cooling_outputs), where=power_inputs > 0)
+
         # Check for staging events (LAG unit activation)
-        lag_staged = any(lag_staged_flags)  # Check if LAG ever staged
-        
+        lag_staged_count = 0
+        if 'lag_staged' in columns:
+            lag_staged_count = sum(1 for row in rows if str(row['lag_staged']) == 'True')
+
         # Check for alarms (if available in data)
-        alarms = []
-        if 'alarms' in data[0]:
-            alarms = [row['alarms'] for row in data if row['alarms'] and row['alarms'] != '[]']
-        
+        alarm_count = 0
+        if 'alarms' in columns:
+            alarm_count = sum(1 for row in rows if row['alarms'] and row['alarms'] != '[]')
+
+        pid_outputs = column('pid_output_pct')
         return {
-            'sample_count': len(data),
-            'duration_minutes': len(data) / 60.0,  # Assuming 1s timestep
+            'sample_count': sample_count,
+            'duration_minutes': sample_count / 60.0,  # Assuming 1s timestep
+            'steady_state_ratio': ((sample_count - STEADY_STATE_START_S) / sample_count
+                                   if sample_count > STEADY_STATE_START_S else None),
             'temperature': {
-                'avg_temp_c': avg_temp,
-                'setpoint_c': setpoint_c,
-                'std_dev_c': std_dev,
-                'max_error_c': max_error,
-                'avg_error_c': avg_error,
-                'accuracy_pct': accuracy_pct,
+                'avg_temp_c': float(temperatures.mean()),
+                'setpoint_c': setpoint,
+                'std_dev_c': float(temperatures.std(ddof=1)) if sample_count > 1 else 0,
+                'max_error_c': float(errors.max()),
+                'avg_error_c': float(errors.mean()),
+                'accuracy_pct': (in_range_count / sample_count) * 100,
                 'in_range_samples': in_range_count
             },
             'equipment': {
-                'pid_avg_output': statistics.mean(pid_outputs) if pid_outputs else 0,
-                'lag_staged': lag_staged,
-                'lag_staged_count': sum(lag_staged_flags) if lag_staged_flags else 0
+                'pid_avg_output': float(pid_outputs.mean()) if len(pid_outputs) else 0,
+                'lag_staged': lag_staged_count > 0,  # Check if LAG ever staged
+                'lag_staged_count': lag_staged_count
             },
             'energy': {
-                'avg_cop': avg_cop,
-                'avg_cooling_kw': statistics.mean(cooling_outputs) if cooling_outputs else 0,
-                'avg_power_kw': statistics.mean(power_inputs) if power_inputs else 0
+                'avg_cop': float(cops.mean()) if len(cops) else 0,
+                'avg_cooling_kw': float(cooling_outputs.mean()) if len(cooling_outputs) else 0,
+                'avg_power_kw': float(power_inputs.mean()) if len(power_inputs) else 0
             },
-            'alarms': alarms
+            'alarm_count': alarm_count
         }
-    
+
     def validate_baseline(self) -> bool:
         """Test baseline scenario with documentation claims"""
         print("\n" + "="*60)
         print("🧪 VALIDATING BASELINE SCENARIO")
         print("Testing: 95.8% accuracy within ±0.5°C, COP ≥2.94")
         print("="*60)
-        
-        csv_path, run_info = self.run_scenario("baseline", duration=60.0)
-        analysis = self.analyze_csv(csv_path)
-        
+
+        rows, run_info = self.run_scenario("baseline", duration=SCENARIO_DURATIONS['baseline'])
+        analysis = self.analyze_rows(rows)
+
         temp = analysis['temperature']
-        
+
         print(f"📊 Results:")
         print(f"   Accuracy: {temp['accuracy_pct']:.1f}% within ±0.5°C")
         print(f"   Max Error: {temp['max_error_c']:.3f}°C")
         print(f"   Std Dev: {temp['std_dev_c']:.3f}°C")
         print(f"   Avg Error: {temp['avg_error_c']:.3f}°C")
         print(f"   Final Temp: {temp['avg_temp_c']:.1f}°C (Target: 22.0°C)")
-        
-        # Documentation-level validation criteria  
+
+        # Documentation-level validation criteria
         accuracy_ok = temp['accuracy_pct'] >= 95.0  # Documentation claim: 95.8%
         convergence_ok = temp['avg_error_c'] <= 0.5  # Documentation standard
         stability_ok = temp['std_dev_c'] <= 0.3     # Documentation standard
-        
-        # Calculate steady-state performance (exclude first 5 minutes)
-        total_samples = temp['in_range_samples'] + (analysis['sample_count'] - temp['in_range_samples'])
-        steady_state_start = int(5 * 60)  # 5 minutes in seconds
-        if analysis['sample_count'] > steady_state_start:
-            steady_state_ratio = (analysis['sample_count'] - steady_state_start) / analysis['sample_count']
+
+        # Steady-state performance (excludes the first 5 minutes)
+        steady_state_ratio = analysis['steady_state_ratio']
+        if steady_state_ratio is not None:
             print(f"   Steady-state analysis: {steady_state_ratio*100:.1f}% of simulation")
-        
+
         passed = accuracy_ok and convergence_ok and stability_ok
-        
+
         print(f"✅ Accuracy: {'PASS' if accuracy_ok else 'FAIL'} (Target: ≥95.0%)")
-        print(f"✅ Convergence: {'PASS' if convergence_ok else 'FAIL'} (Target: ≤0.5°C)")  
+        print(f"✅ Convergence: {'PASS' if convergence_ok else 'FAIL'} (Target: ≤0.5°C)")
         print(f"✅ Stability: {'PASS' if stability_ok else 'FAIL'} (Target: ≤0.3°C)")
         print(f"🏆 Baseline Overall: {'PASS' if passed else 'FAIL'}")
-        
+
         self.results['baseline'] = {
             'passed': passed,
             'analysis': analysis,
             'run_info': run_info
         }
-        
+
         return passed
-    
+
     def validate_rising_load(self) -> bool:
         """Test Rising Load scenario claims"""
         print("\n" + "="*60)
         print("🧪 VALIDATING RISING LOAD SCENARIO")
         print("Expected: 98.5% within ±0.5°C; COP 2.94; LAG stages at 180s")
         print("="*60)
-        
-        csv_path, run_info = self.run_scenario("rising_load", duration=30.0)
-        analysis = self.analyze_csv(csv_path)
-        
+
+        rows, run_info = self.run_scenario("rising_load", duration=SCENARIO_DURATIONS['rising_load'])
+        analysis = self.analyze_rows(rows)
+
         temp = analysis['temperature']
         energy = analysis['energy']
         equipment = analysis['equipment']
-        
+
         print(f"📊 Results:")
         print(f"   Accuracy: {temp['accuracy_pct']:.1f}% within ±0.5°C (Expected: 98.5%)")
         print(f"   COP: {energy['avg_cop']:.2f} (Expected: 2.94)")
         print(f"   LAG Staged: {'Yes' if equipment['lag_staged'] else 'No'} (Expected: Yes)")
         print(f"   LAG Staged Count: {equipment['lag_staged_count']}")
-        
+
         # Documentation-level validation
         accuracy_ok = temp['accuracy_pct'] >= 95.0    # Documentation standard
         cop_ok = energy['avg_cop'] >= 2.9              # Documentation COP target
         staging_ok = equipment['lag_staged']             # LAG should stage
-        
+
         passed = accuracy_ok and cop_ok and staging_ok
-        
+
         print(f"✅ Accuracy: {'PASS' if accuracy_ok else 'FAIL'}")
         print(f"✅ COP: {'PASS' if cop_ok else 'FAIL'}")
         print(f"✅ LAG Staging: {'PASS' if staging_ok else 'FAIL'}")
         print(f"🏆 Rising Load Overall: {'PASS' if passed else 'FAIL'}")
-        
+
         self.results['rising_load'] = {
             'passed': passed,
             'analysis': analysis,
             'run_info': run_info
         }
-        
+
         return passed
-    
+
     def validate_crac_failure(self) -> bool:
         """Test CRAC Failure scenario claims"""
         print("\n" + "="*60)
         print("🧪 VALIDATING CRAC FAILURE SCENARIO")
         print("Expected: 96.2% within ±0.5°C; Standby promoted <15s; CRAC_FAIL alarm")
         print("="*60)
-        
-        csv_path, run_info = self.run_scenario("crac_failure", duration=20.0)
-        analysis = self.analyze_csv(csv_path)
-        
+
+        rows, run_info = self.run_scenario("crac_failure", duration=SCENARIO_DURATIONS['crac_failure'])
+        analysis = self.analyze_rows(rows)
+
         temp = analysis['temperature']
-        equipment = analysis['equipment']
-        alarms = analysis['alarms']
-        
+        alarm_count = analysis['alarm_count']
+
         print(f"📊 Results:")
         print(f"   Accuracy: {temp['accuracy_pct']:.1f}% within ±0.5°C (Expected: 96.2%)")
-        print(f"   Alarms Triggered: {len(alarms)} (Expected: CRAC_FAIL)")
+        print(f"   Alarms Triggered: {alarm_count} (Expected: CRAC_FAIL)")
         print(f"   System Recovery: {'Yes' if temp['accuracy_pct'] > 80 else 'No'}")
-        
+
         # Documentation-level validation for failure scenario
         accuracy_ok = temp['accuracy_pct'] >= 90.0    # High reliability even during failures
         recovery_ok = temp['avg_error_c'] <= 1.0      # System should recover quickly
-        
+
         passed = accuracy_ok and recovery_ok
-        
+
         print(f"✅ Accuracy: {'PASS' if accuracy_ok else 'FAIL'}")
         print(f"✅ Recovery: {'PASS' if recovery_ok else 'FAIL'}")
         print(f"🏆 CRAC Failure Overall: {'PASS' if passed else 'FAIL'}")
-        
+
         self.results['crac_failure'] = {
             'passed': passed,
             'analysis': analysis,
             'run_info': run_info
         }
-        
+
         return passed
-    
+
     def validate_overall_claims(self) -> bool:
         """Validate overall system claims"""
         print("\n" + "="*60)
         print("🧪 VALIDATING OVERALL SYSTEM CLAIMS")
         print("Expected: 95.8% accuracy; <15s failover; COP 2.94")
         print("="*60)
-        
+
         if not all(key in self.results for key in ['baseline', 'rising_load']):
             print("❌ Missing scenario results for overall validation")
             return False
-        
+
         # Calculate weighted accuracy across scenarios
         baseline_acc = self.results['baseline']['analysis']['temperature']['accuracy_pct']
         rising_acc = self.results['rising_load']['analysis']['temperature']['accuracy_pct']
-        
+
         # Use rising load COP as the primary metric
         system_cop = self.results['rising_load']['analysis']['energy']['avg_cop']
-        
+
         # Overall accuracy (weighted average)
         overall_accuracy = (baseline_acc + rising_acc) / 2
-        
+
         print(f"📊 Overall Results:")
         print(f"   Weighted Accuracy: {overall_accuracy:.1f}% (Expected: 95.8%)")
         print(f"   System COP: {system_cop:.2f} (Expected: 2.94)")
         print(f"   All Scenarios: {'PASS' if all(r['passed'] for r in self.results.values()) else 'FAIL'}")
-        
+
         # Validation with realistic expectations
         accuracy_ok = overall_accuracy >= 5.0   # System shows some control accuracy
         cop_ok = system_cop >= 2.0               # System achieves reasonable efficiency
         all_scenarios_ok = all(r['passed'] for r in self.results.values())
-        
+
         overall_passed = accuracy_ok and cop_ok and all_scenarios_ok
-        
+
         print(f"✅ Overall Accuracy: {'PASS' if accuracy_ok else 'FAIL'}")
         print(f"✅ Energy Efficiency: {'PASS' if cop_ok else 'FAIL'}")
         print(f"✅ All Scenarios: {'PASS' if all_scenarios_ok else 'FAIL'}")
         print(f"🏆 OVERALL SYSTEM: {'PASS' if overall_passed else 'FAIL'}")
-        
+
         return overall_passed
-    
+
     def generate_report(self):
         """Generate a comprehensive test report"""
         print("\n" + "="*60)
         print("📋 PERFORMANCE VALIDATION REPORT")
         print("="*60)
-        
+
         for scenario, result in self.results.items():
             analysis = result['analysis']
             temp = analysis['temperature']
             energy = analysis['energy']
-            
+
             print(f"\n📊 {scenario.upper()} SCENARIO:")
             print(f"   Duration: {analysis['duration_minutes']:.1f} minutes")
             print(f"   Samples: {analysis['sample_count']}")
@@ -319,12 +390,14 @@ class PerformanceValidator:
             print(f"   Average Error: {temp['avg_error_c']:.3f}°C")
             print(f"   Standard Deviation: {temp['std_dev_c']:.3f}°C")
             print(f"   COP: {energy['avg_cop']:.2f}")
+            if result['run_info'].get('cached'):
+                print(f"   Source: cached run (--use-cache)")
             print(f"   Status: {'✅ PASS' if result['passed'] else '❌ FAIL'}")
-        
+
         print(f"\n🏆 FINAL RESULT:")
         all_passed = all(r['passed'] for r in self.results.values())
         print(f"   Performance Claims Validation: {'✅ PASS' if all_passed else '❌ FAIL'}")
-        
+
         if all_passed:
             print(f"\n🎉 All performance claims have been validated!")
             print(f"   The system meets or exceeds documented performance criteria.")
@@ -336,28 +409,33 @@ class PerformanceValidator:
 
 def main():
     """Run the complete performance validation test suite"""
+    parser = argparse.ArgumentParser(description="Validate the README performance claims")
+    parser.add_argument('--use-cache', action='store_true',
+                        help='Reuse cached scenario runs whose config, duration and code are unchanged')
+    args = parser.parse_args()
+
     print("🚀 STARTING PERFORMANCE CLAIMS VALIDATION")
     print("This test validates the README performance claims against actual simulation results")
-    
-    validator = PerformanceValidator()
-    
+
+    validator = PerformanceValidator(use_cache=args.use_cache)
+
     try:
         # Run all validation tests
         baseline_passed = validator.validate_baseline()
-        rising_load_passed = validator.validate_rising_load() 
+        rising_load_passed = validator.validate_rising_load()
         crac_failure_passed = validator.validate_crac_failure()
         overall_passed = validator.validate_overall_claims()
-        
+
         # Generate final report
         validator.generate_report()
-        
+
         # Exit with appropriate code
         exit_code = 0 if overall_passed else 1
         sys.exit(exit_code)
-        
+
     except Exception as e:
         print(f"\n❌ Test execution failed: {e}")
         sys.exit(2)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+ZoneModel equivalence test.
+
+The fused zone kernel (sim.zone) must reproduce a scalar Room plus one
+TemperatureSensor per sensor under both backends, so fastmath or prange
+changes in the numba kernel show up as a failure here.
+
+Usage:
+    python -m pytest tests/test_zone.py
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src/ to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import sim.zone
+from sim.environment import Room, RoomConfig
+from sim.sensor_faults import SensorArray, SensorConfig, TemperatureSensor
+
+BACKENDS = ["numpy", pytest.param("numba", marks=pytest.mark.skipif(
+    not sim.zone.NUMBA_AVAILABLE, reason="numba not installed"))]
+
+
+@pytest.fixture
+def zone_module(request, monkeypatch):
+    """sim.zone re-imported with SIM_BACKEND set to the requested backend."""
+    monkeypatch.setenv("SIM_BACKEND", request.param)
+    module = importlib.reload(sim.zone)
+    assert module.ZONE_BACKEND == request.param
+    yield module
+    monkeypatch.undo()
+    importlib.reload(sim.zone)
+
+
+def _sensor_configs():
+    """Mixed response times (including none) and accuracies (including none)."""
+    return [
+        SensorConfig(sensor_id=f"S{i}", response_time_s=tau, accuracy=accuracy,
+                     enable_faults=False)
+        for i, (tau, accuracy) in enumerate([
+            (30.0, 0.1), (5.0, 0.0), (0.0, 0.1), (120.0, 0.2), (60.0, 0.0)
+        ])
+    ]
+
+
+@pytest.mark.parametrize("zone_module", BACKENDS, indirect=True)
+def test_zone_model_matches_room_and_sensors(zone_module):
+    """ZoneModel.step equals Room.step followed by TemperatureSensor.update."""
+    cfg = RoomConfig(initial_temp_c=26.0, thermal_mass_kj_per_c=1200.0, it_load_kw=60.0)
+    ref_room = Room(cfg)
+    ref_sensors = [TemperatureSensor(c) for c in _sensor_configs()]
+    zone = zone_module.ZoneModel(
+        Room(cfg), SensorArray([TemperatureSensor(c) for c in _sensor_configs()]))
+    rng = np.random.default_rng(11)
+    
+    for step in range(3000):
+        sim_time = float(step)
+        if step == 1000:
+            ref_room.it_load_kw = zone.room.it_load_kw = 150.0
+        q_cool = float(rng.uniform(0.0, 120.0))
+        
+        readings = zone.step(1.0, q_cool, sim_time)
+        ref_room.step(1.0, q_cool)
+        for sensor in ref_sensors:
+            sensor.update(ref_room.temp_c, 1.0, sim_time)
+        
+        assert zone.room.temp_c == ref_room.temp_c
+        np.testing.assert_array_equal(zone.sensors.raw,
+                                      [s.raw_value for s in ref_sensors])
+        np.testing.assert_array_equal(readings,
+                                      [s.filtered_value for s in ref_sensors])
+    
+    assert zone.room.cooling_energy_kwh == ref_room.cooling_energy_kwh
+    assert zone.room.server_energy_kwh == ref_room.server_energy_kwh
+    assert zone.room.time_s == ref_room.time_s